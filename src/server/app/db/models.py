@@ -1,6 +1,6 @@
 from datetime import datetime, timezone
 
-from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, Integer, String, Table
+from sqlalchemy import JSON, Boolean, Column, DateTime, Float, ForeignKey, Integer, String, Table
 from sqlalchemy.orm import relationship
 
 from app.db.database import Base
@@ -27,7 +27,7 @@ class Track(Base):
 
     __tablename__ = "tracks"
     id = Column(Integer, primary_key=True)
-    spotify_id = Column(String, nullable=False)
+    spotify_id = Column(String, unique=True, nullable=False, index=True)
     title = Column(String, nullable=False)
     listened_count = Column(Integer, default=0)
     added_at = Column(DateTime, default=datetime.now(tz=timezone.utc))
@@ -44,6 +44,10 @@ class Playlist(Base):
         id (int): The unique identifier for the playlist.
         name (str): The name of the playlist.
         tracks (relationship): A many-to-many relationship with the Track model.
+        track_titles (list[str]): The titles of the playlist's tracks, stored alongside the row
+            so membership checks do not need to join the tracks.
+        snapshot_id (str): The Spotify snapshot ID of the playlist version the track titles
+            belong to.
     """
 
     __tablename__ = "playlists"
@@ -53,6 +57,8 @@ class Playlist(Base):
     tracks = relationship(
         "Track", secondary=playlist_track_association_table, back_populates="playlists"
     )
+    track_titles = Column(JSON, nullable=False, default=list, server_default="[]")
+    snapshot_id = Column(String, nullable=True)
     created_at = Column(DateTime, default=datetime.now(tz=timezone.utc))
 
 
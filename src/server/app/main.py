@@ -4,6 +4,8 @@ import app.routers.playlists_router as playlists_router
 import app.routers.tracks_router as tracks_router
 import app.routers.user_auth_router as user_auth_router
 from app.db.database import get_db
+from app.services.http_client import close_http_client
+from app.services.redis_client import close_redis_client
 from app.services.tracks_service import update_polling_status
 from fastapi import FastAPI
 
@@ -11,8 +13,11 @@ from fastapi import FastAPI
 @asynccontextmanager
 async def app_lifespan(app: FastAPI):
     db_session = next(get_db())
+    app.openapi()
     yield
     await update_polling_status(db_session, enable=False)
+    await close_http_client()
+    await close_redis_client()
 
 
 app = FastAPI(lifespan=app_lifespan)
@@ -0,0 +1,100 @@
+import asyncio
+import math
+import random
+from typing import Awaitable, Callable
+
+import httpx
+
+HTTP_CLIENT_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+HTTP_CLIENT_TIMEOUT = httpx.Timeout(10.0)
+RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_INITIAL_DELAY = 1.0
+RATE_LIMIT_MAX_DELAY = 60.0
+MAX_CONCURRENT_SPOTIFY_API_REQUESTS = 32
+
+_http_client: httpx.AsyncClient | None = None
+_spotify_api_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SPOTIFY_API_REQUESTS)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Retrieve the application-wide HTTP client, creating it on first use.
+
+    The client keeps a pool of connections alive, so subsequent requests to Spotify
+    reuse already established TCP/TLS sessions instead of opening new ones. HTTP/2 is enabled,
+    so concurrent requests to the same host are multiplexed over a single connection.
+
+    Returns:
+        httpx.AsyncClient: The shared asynchronous HTTP client.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=True, limits=HTTP_CLIENT_LIMITS, timeout=HTTP_CLIENT_TIMEOUT
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """
+    Close the application-wide HTTP client and release its pooled connections.
+    """
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def get_retry_delay(response: httpx.Response, delay: float) -> float:
+    """
+    Determine how long to wait before retrying a rate limited request.
+
+    The Retry-After header is used if it holds a number of seconds. Otherwise, for example
+    when it is missing or holds an HTTP date, the delay is randomly extended by up to its own
+    length. The result never exceeds one minute.
+
+    Args:
+        response (httpx.Response): The rate limited response.
+        delay (float): The backoff delay of the current attempt in seconds.
+
+    Returns:
+        float: The number of seconds to wait before the next attempt.
+    """
+    try:
+        retry_after = float(response.headers.get("Retry-After", ""))
+    except ValueError:
+        retry_after = math.nan
+    if not 0 <= retry_after < math.inf:
+        retry_after = delay + random.uniform(0, delay)
+    return min(retry_after, RATE_LIMIT_MAX_DELAY)
+
+
+async def send_with_rate_limit_retry(
+    send: Callable[[], Awaitable[httpx.Response]],
+) -> httpx.Response:
+    """
+    Send a request to the Spotify API and retry it while it responds with 429 Too Many Requests.
+
+    At most 32 requests are in flight at once across the whole application, so bursts of
+    concurrent calls are throttled before they reach Spotify. The delay before each retry is
+    taken from the Retry-After header. If the header is missing or not a number of seconds,
+    the delay starts at one second, doubles with every attempt and is randomly extended by up
+    to its own length. No single delay exceeds one minute.
+
+    Args:
+        send (Callable[[], Awaitable[httpx.Response]]): A callable sending the request.
+
+    Returns:
+        httpx.Response: The first response that was not rate limited, or the last response
+        if all retries were rate limited.
+    """
+    delay = RATE_LIMIT_INITIAL_DELAY
+    for _ in range(RATE_LIMIT_RETRIES):
+        async with _spotify_api_semaphore:
+            response = await send()
+        if response.status_code != httpx.codes.TOO_MANY_REQUESTS:
+            return response
+        await asyncio.sleep(get_retry_delay(response, delay))
+        delay *= 2
+    async with _spotify_api_semaphore:
+        return await send()
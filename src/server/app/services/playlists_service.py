@@ -1,49 +1,167 @@
 import asyncio
-from itertools import chain
 
 import httpx
-from app.db.models import Playlist, Track
+import orjson
+from app.db.models import Playlist, Track, playlist_track_association_table
+from app.services.http_client import get_http_client, send_with_rate_limit_retry
+from app.services.redis_client import get_redis_client
 from app.services.token_manager import get_spotify_headers
-from app.services.tracks_service import fetch_listened_tracks
+from app.services.tracks_service import fetch_listened_tracks, has_listened_tracks
 from app.services.user_auth_service import get_current_user_id
-from app.services.utils import config
+from app.services.utils import config, gather_or_cancel
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
-from upstash_redis.asyncio import Redis
 
-
-async def get_playlists_from_spotify(offset: int, limit: int, db_session: Session) -> dict:
+SPOTIFY_FAV_PLAYLIST_SUFFIX = "_spotify_fav"
+SPOTIFY_TRACK_URI_PREFIX = "spotify:track:"
+PLAYLISTS_PAGE_LIMIT = 50
+MAX_CONCURRENT_SPOTIFY_REQUESTS = 8
+PLAYLISTS_CACHE_TTL = 30
+PLAYLISTS_STALE_CACHE_TTL = 3600
+PLAYLIST_CACHED_FIELDS = ("id", "name", "uri", "snapshot_id")
+ADD_TRACKS_BATCH_SIZE = 100
+PLAYLIST_TRACKS_PAGE_LIMIT = 100
+PLAYLIST_TRACKS_CACHE_TTL = 3600
+PLAYLIST_TRACKS_FIELDS = "total,items(track(name))"
+
+
+async def get_playlists_from_spotify(
+    offset: int,
+    limit: int,
+    db_session: Session,
+    spotify_headers: dict[str, str] | None = None,
+    user_id: str | None = None,
+) -> dict:
     """
     Retrieve the current user's playlists from Spotify.
+    Only the fields the application uses are kept. Responses are cached in Redis for a short time,
+    a longer-lived copy of the last response is served instead if Spotify fails with a server
+    error. If Redis is unavailable, the playlists are retrieved from Spotify without the cache.
 
     Args:
         offset (int): The index of the first playlist to return.
         limit (int): The number of playlists to return.
         db_session (Session): The SQLAlchemy session to interact with the database.
+        spotify_headers (dict[str, str] | None): Already resolved headers for the Spotify API
+            requests. If not provided, they are retrieved using the current access token.
+        user_id (str | None): The Spotify user ID of the current user. If not provided,
+            it is retrieved from Spotify.
 
     Returns:
-        dict: A JSON response from Spotify containing the user's playlists.
+        dict: The page of the user's playlists, reduced to the used fields.
 
     Raises:
         HTTPException: If the Spotify API request fails, an HTTPException is raised with the
         status code and error details from the response.
     """
-    headers = await get_spotify_headers(db_session)
-    async with httpx.AsyncClient() as client:
-        try:
-            user_id = await get_current_user_id(db_session)
-            url = f"{config['SPOTIFY_API_URL']}/users/{user_id}/playlists?offset={offset}&limit={limit}"
-            response = await client.get(url, headers=headers)
-            response.raise_for_status()
-        except httpx.HTTPStatusError as exc:
-            raise HTTPException(
-                status_code=exc.response.status_code, detail=exc.response.text
-            ) from exc
-        except Exception as exc:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(exc)
-            ) from exc
-        return response.json()
+    headers = spotify_headers or await get_spotify_headers(db_session)
+    client = get_http_client()
+    try:
+        user_id = user_id or await get_current_user_id(db_session, headers)
+        cache_key = f"playlists:{user_id}:{offset}:{limit}"
+        cached_playlists = await read_playlists_cache(cache_key)
+        if cached_playlists:
+            return cached_playlists
+        url = f"{config['SPOTIFY_API_URL']}/users/{user_id}/playlists"
+        response = await send_with_rate_limit_retry(
+            lambda: client.get(url, headers=headers, params={"offset": offset, "limit": limit})
+        )
+        response.raise_for_status()
+        playlists = trim_playlists_page(orjson.loads(response.content))
+        await write_playlists_cache(user_id, cache_key, playlists)
+    except httpx.HTTPStatusError as exc:
+        if exc.response.is_server_error:
+            stale_playlists = await read_playlists_cache(f"{cache_key}:stale")
+            if stale_playlists:
+                return stale_playlists
+        raise HTTPException(status_code=exc.response.status_code, detail=exc.response.text) from exc
+    except Exception as exc:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(exc)
+        ) from exc
+    return playlists
+
+
+def trim_playlists_page(page: dict) -> dict:
+    """
+    Reduce a page of playlists returned by Spotify to the fields the application uses.
+
+    Args:
+        page (dict): The page of playlists returned by Spotify.
+
+    Returns:
+        dict: The page with its total, offset and limit, and the ID, name, URI, snapshot ID
+        and number of tracks of each playlist.
+    """
+    return {
+        "total": page.get("total"),
+        "offset": page.get("offset"),
+        "limit": page.get("limit"),
+        "items": [
+            {
+                **{field: playlist.get(field) for field in PLAYLIST_CACHED_FIELDS},
+                "tracks": {"total": (playlist.get("tracks") or {}).get("total")},
+            }
+            for playlist in page.get("items", [])
+            if playlist
+        ],
+    }
+
+
+def get_playlists_cache_index_key(user_id: str) -> str:
+    """
+    Build the key of the Redis set listing the user's cached playlists pages.
+
+    Args:
+        user_id (str): The Spotify user ID.
+
+    Returns:
+        str: The cache key of the user's playlists cache index.
+    """
+    return f"playlists:{user_id}:keys"
+
+
+async def read_playlists_cache(cache_key: str) -> dict | None:
+    """
+    Read a cached page of playlists from Redis.
+    Redis failures are treated as a cache miss, so an unavailable cache does not fail the request.
+
+    Args:
+        cache_key (str): The cache key of the page.
+
+    Returns:
+        dict | None: The cached page, or None if it is not cached or Redis is unavailable.
+    """
+    try:
+        cached_playlists = await get_redis_client().get(cache_key)
+    except Exception:
+        return None
+    return orjson.loads(cached_playlists) if cached_playlists else None
+
+
+async def write_playlists_cache(user_id: str, cache_key: str, playlists: dict) -> None:
+    """
+    Cache a page of playlists in Redis, together with its longer-lived stale copy.
+    Both keys are recorded in the user's cache index, so they can be invalidated without
+    scanning the keyspace. Redis failures are ignored, the page is just not cached.
+
+    Args:
+        user_id (str): The Spotify user ID.
+        cache_key (str): The cache key of the page.
+        playlists (dict): The page of playlists to cache.
+    """
+    value = orjson.dumps(playlists).decode()
+    index_key = get_playlists_cache_index_key(user_id)
+    stale_cache_key = f"{cache_key}:stale"
+    try:
+        pipeline = get_redis_client().pipeline()
+        pipeline.set(cache_key, value, ex=PLAYLISTS_CACHE_TTL)
+        pipeline.set(stale_cache_key, value, ex=PLAYLISTS_STALE_CACHE_TTL)
+        pipeline.sadd(index_key, cache_key, stale_cache_key)
+        pipeline.expire(index_key, PLAYLISTS_STALE_CACHE_TTL)
+        await pipeline.exec()
+    except Exception:
+        return
 
 
 async def retrieve_playlist_from_spotify_by_spotify_id(
@@ -61,39 +179,52 @@ async def retrieve_playlist_from_spotify_by_spotify_id(
     """
     url = f"{config['SPOTIFY_API_URL']}/playlists/{spotify_id}"
     spotify_headers = await get_spotify_headers(db_session)
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=spotify_headers)
-        return response.json()
+    response = await send_with_rate_limit_retry(
+        lambda: get_http_client().get(url, headers=spotify_headers)
+    )
+    return orjson.loads(response.content)
 
 
-async def sync_playlists(db_session: Session) -> None:
+async def sync_playlists(
+    db_session: Session, spotify_headers: dict[str, str] | None = None
+) -> dict:
     """
     Synchronize spotify-fav playlists between database and the Spotify.
 
     Args:
         db_session (Session): The SQLAlchemy session to interact with the database.
+        spotify_headers (dict[str, str] | None): Already resolved headers for the Spotify API
+            requests. If not provided, they are retrieved using the current access token.
 
     Returns:
-        None
+        dict: A dictionary containing the list of all user's playlists fetched from Spotify
+        during the synchronization, so callers do not need to fetch them again.
     """
-    db_playlists_ids = {playlist.spotify_id for playlist in db_session.query(Playlist).all()}
-    spotify_playlists = await get_all_playlists(db_session)
+    spotify_playlists = await get_all_playlists(db_session, spotify_headers)
     spotify_playlists_ids = {
         playlist["id"]
-        for playlist in list(spotify_playlists.values())[0]
-        if "spotify_fav" in playlist["name"]
+        for playlist in spotify_playlists["playlists"]
+        if playlist["name"].endswith(SPOTIFY_FAV_PLAYLIST_SUFFIX)
     }
-    playlists_to_remove_ids = db_playlists_ids - spotify_playlists_ids
-    db_session.query(Playlist).filter(Playlist.spotify_id.in_(playlists_to_remove_ids)).delete()
+    db_session.query(Playlist).filter(Playlist.spotify_id.notin_(spotify_playlists_ids)).delete(
+        synchronize_session=False
+    )
     db_session.commit()
+    return spotify_playlists
 
 
-async def get_all_playlists(db_session: Session) -> dict:
+async def get_all_playlists(
+    db_session: Session, spotify_headers: dict[str, str] | None = None
+) -> dict:
     """
     Retrieve all playlists for the current user from Spotify by fetching in batches.
+    The first page reports the total count, the remaining pages are fetched concurrently.
 
     Args:
         db_session (Session): The SQLAlchemy session to interact with the database.
+        spotify_headers (dict[str, str] | None): Already resolved headers for the Spotify API
+            requests. If not provided, they are retrieved once and shared by all pages.
+        The current user's Spotify ID is likewise retrieved once and shared by all pages.
 
     Returns:
         dict: A dictionary containing the list of all user's playlists from Spotify.
@@ -102,16 +233,28 @@ async def get_all_playlists(db_session: Session) -> dict:
         HTTPException: If any error occurs during the Spotify API requests, it raises an HTTPException
         with a specific status code and error details.
     """
-    playlists = []
-    offset, limit = 0, 50
+    limit = PLAYLISTS_PAGE_LIMIT
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SPOTIFY_REQUESTS)
+
+    async def fetch_page(offset: int) -> dict:
+        async with semaphore:
+            return await get_playlists_from_spotify(
+                offset, limit, db_session, spotify_headers, user_id
+            )
+
     try:
-        while True:
-            response = await get_playlists_from_spotify(offset, limit, db_session)
-            items = response.get("items", [])
-            if not items:
-                break
-            playlists.extend(items)
-            offset += limit
+        spotify_headers = spotify_headers or await get_spotify_headers(db_session)
+        user_id = await get_current_user_id(db_session, spotify_headers)
+        first_page = await get_playlists_from_spotify(
+            0, limit, db_session, spotify_headers, user_id
+        )
+        playlists = first_page.get("items", [])
+        total = first_page.get("total", len(playlists))
+        pages = await gather_or_cancel(
+            *[fetch_page(offset) for offset in range(limit, total, limit)]
+        )
+        for page in pages:
+            playlists.extend(page.get("items", []))
     except HTTPException as http_exc:
         raise http_exc
     except Exception as exc:
@@ -121,20 +264,38 @@ async def get_all_playlists(db_session: Session) -> dict:
     return {"playlists": playlists}
 
 
-async def filter_new_tracks(db_session: Session, playlists: dict) -> list[Track]:
+async def filter_new_tracks(
+    db_session: Session,
+    playlists: dict,
+    spotify_headers: dict[str, str] | None = None,
+    tracks: list[Track] | None = None,
+) -> list[Track]:
     """
     Filter out tracks that are already included in existing playlists.
+    Tracks of playlists stored in the database are read with a single query, only the remaining
+    playlists, and those changed on Spotify since they were stored, are looked up in the cache
+    or on Spotify.
 
     Args:
         db_session (Session): The SQLAlchemy session to interact with the database.
         playlists (dict): A dictionary containing existing playlists and their tracks.
+        spotify_headers (dict[str, str] | None): Already resolved headers for the Spotify API
+            requests. If not provided, they are retrieved using the current access token.
+        tracks (list[Track] | None): Already fetched listened tracks. If not provided, they are
+            retrieved from the database.
 
     Returns:
         list: A list of tracks that are new and not included in any existing playlists.
     """
-    tracks = fetch_listened_tracks(db_session)
-    playlist_tracks = await cache_playlist_tracks(playlists["playlists"], db_session)
-    existing_track_titles = list(chain.from_iterable(playlist_tracks.values()))
+    tracks = tracks if tracks is not None else fetch_listened_tracks(db_session)
+    playlist_tracks = get_db_playlist_tracks(playlists["playlists"], db_session)
+    remaining_playlists = [
+        playlist for playlist in playlists["playlists"] if playlist["id"] not in playlist_tracks
+    ]
+    playlist_tracks.update(
+        await cache_playlist_tracks(remaining_playlists, db_session, spotify_headers)
+    )
+    existing_track_titles = set().union(*playlist_tracks.values())
     return [track for track in tracks if track.title not in existing_track_titles]
 
 
@@ -143,6 +304,10 @@ async def create_playlist(
 ) -> None:
     """
     Create a new playlist on Spotify and store it in the local database.
+    The playlist is stored only after all tracks were added on Spotify, so tracks of a partially
+    filled playlist are not treated as already included and are picked up again next time.
+    The Spotify IDs of the tracks are read before the database write, which commits and thereby
+    expires the track objects, so they are not reloaded one by one afterwards.
 
     Args:
         playlist_name (str): The name of the playlist to be created.
@@ -154,10 +319,12 @@ async def create_playlist(
     Returns:
         None
     """
+    track_ids = [track.spotify_id for track in tracks_db]
     playlist_id = await create_playlist_on_spotify(user_id, playlist_name, spotify_headers)
-    create_playlist_in_db(playlist_name, playlist_id, tracks_db, db_session)
-    await add_tracks_to_playlist(
-        playlist_id, [track.spotify_id for track in tracks_db], spotify_headers
+    await invalidate_playlists_cache(user_id)
+    snapshot_id = await add_tracks_to_playlist(playlist_id, track_ids, spotify_headers)
+    await asyncio.to_thread(
+        create_playlist_in_db, playlist_name, playlist_id, tracks_db, db_session, snapshot_id
     )
 
 
@@ -165,6 +332,11 @@ async def process_playlist_creation(playlist_name: str, db_session: Session) ->
     """
     Create a new playlist in the local database and on Spotify.
     The playlist will include tracks that are not included in any already existing one.
+    The existence of listened tracks is checked first, so the Spotify synchronization is skipped
+    entirely when there are none. The tracks themselves are loaded only after the synchronization
+    committed, as the commit would expire them and each would then be reloaded separately.
+    The larger database reads and writes run in a worker thread, so they do not block the event
+    loop.
 
     Args:
         playlist_name (str): The name of the playlist to be created.
@@ -177,13 +349,18 @@ async def process_playlist_creation(playlist_name: str, db_session: Session) ->
         HTTPException: If there is an HTTP error when interacting with Spotify's API.
     """
     try:
-        await sync_playlists(db_session)
-        user_id, playlists, spotify_headers = await asyncio.gather(
-            get_current_user_id(db_session),
-            get_all_playlists(db_session),
-            get_spotify_headers(db_session),
+        if not await asyncio.to_thread(has_listened_tracks, db_session):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="No tracks you have listened to were found.",
+            )
+        spotify_headers = await get_spotify_headers(db_session)
+        user_id, playlists = await gather_or_cancel(
+            get_current_user_id(db_session, spotify_headers),
+            sync_playlists(db_session, spotify_headers),
         )
-        tracks_db = await filter_new_tracks(db_session, playlists)
+        tracks = await asyncio.to_thread(fetch_listened_tracks, db_session)
+        tracks_db = await filter_new_tracks(db_session, playlists, spotify_headers, tracks)
         if not tracks_db:
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -219,106 +396,267 @@ async def create_playlist_on_spotify(
         raised with the status code and error details from the response.
     """
     url = f"{config['SPOTIFY_API_URL']}/users/{user_id}/playlists"
-    playlist_name = f"{playlist_name}_spotify_fav"
+    playlist_name = f"{playlist_name}{SPOTIFY_FAV_PLAYLIST_SUFFIX}"
     payload = {"name": playlist_name}
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, headers=spotify_headers, json=payload)
-        response.raise_for_status()
-        return response.json()["id"]
+    response = await send_with_rate_limit_retry(
+        lambda: get_http_client().post(url, headers=spotify_headers, json=payload)
+    )
+    response.raise_for_status()
+    return orjson.loads(response.content)["id"]
+
+
+async def invalidate_playlists_cache(user_id: str) -> None:
+    """
+    Remove all cached playlists listings of the user, including their stale copies.
+    Called after a playlist is created, so the next synchronization sees the new playlist
+    instead of a cached listing without it. The keys are taken from the user's cache index.
+
+    Args:
+        user_id (str): The Spotify user ID.
+    """
+    redis_client = get_redis_client()
+    index_key = get_playlists_cache_index_key(user_id)
+    cache_keys = await redis_client.smembers(index_key)
+    await redis_client.delete(index_key, *cache_keys)
 
 
 def create_playlist_in_db(
-    playlist_name: str, playlist_id: str, tracks: list, db_session: Session
+    playlist_name: str,
+    playlist_id: str,
+    tracks: list,
+    db_session: Session,
+    snapshot_id: str | None = None,
 ) -> Playlist:
     """
     Create a new playlist entry in the local database and associate it with the given tracks.
+    The associations are written with a single bulk insert instead of through the relationship.
 
     Args:
         playlist_name (str): The name of the playlist.
         playlist_id (str): The ID of the playlist based on Spotify's playlist creation.
-        tracks (list): A list of tracks to associate with the playlist.
+        tracks (list): A list of tracks, already stored in the database, to associate with the
+            playlist.
         db_session (Session): The SQLAlchemy session to interact with the database.
+        snapshot_id (str | None): The Spotify snapshot ID of the playlist after the tracks
+            were added.
 
     Returns:
         Playlist: The created playlist object.
     """
-    playlist = Playlist(name=playlist_name, spotify_id=playlist_id, tracks=tracks)
+    playlist = Playlist(
+        name=playlist_name,
+        spotify_id=playlist_id,
+        track_titles=[track.title for track in tracks],
+        snapshot_id=snapshot_id,
+    )
     db_session.add(playlist)
+    db_session.flush()
+    if tracks:
+        db_session.execute(
+            playlist_track_association_table.insert(),
+            [{"playlist_id": playlist.id, "track_id": track.id} for track in tracks],
+        )
     db_session.commit()
     return playlist
 
 
+def get_db_playlist_tracks(playlists: list[dict], db_session: Session) -> dict[str, set[str]]:
+    """
+    Retrieve the titles of tracks associated with the given playlists stored in the database.
+    The titles are read from the playlist rows, so no join with the tracks table is needed.
+    They are only used while the playlist's snapshot ID on Spotify matches the stored one,
+    so playlists edited outside the application are not served from outdated titles.
+
+    Args:
+        playlists (list[dict]): The playlists to look up, as listed by Spotify.
+        db_session (Session): The SQLAlchemy session to interact with the database.
+
+    Returns:
+        dict[str, set[str]]: A dictionary with playlist Spotify IDs as keys and sets of track
+        titles as values. Playlists that are not stored in the database, have no tracks or
+        changed on Spotify since they were stored are not included.
+    """
+    snapshot_ids = {playlist["id"]: playlist.get("snapshot_id") for playlist in playlists}
+    if not snapshot_ids:
+        return {}
+    rows = (
+        db_session.query(Playlist.spotify_id, Playlist.track_titles, Playlist.snapshot_id)
+        .filter(Playlist.spotify_id.in_(snapshot_ids))
+        .all()
+    )
+    return {
+        spotify_id: set(track_titles)
+        for spotify_id, track_titles, snapshot_id in rows
+        if track_titles and snapshot_id and snapshot_id == snapshot_ids[spotify_id]
+    }
+
+
 async def add_tracks_to_playlist(
     playlist_id: str, track_ids: list[str], spotify_headers: dict[str, str]
-) -> None:
+) -> str | None:
     """
     Add tracks to a Spotify playlist.
+    Spotify accepts at most 100 URIs per request, so the tracks are sent in batches. The batches
+    are sent one after another, so the tracks keep their order in the playlist and a failed batch
+    stops the remaining ones. Rate limited batches are retried with a backoff.
 
     Args:
         playlist_id (str): The ID of the playlist to which tracks will be added.
         track_ids (list[str]): List of track IDs to add to the playlist.
-        spotify_headers (dict[str, str]): Headers for the Spotify API request.
+        spotify_headers (dict[str, str]): Headers for the Spotify API request, including
+            the JSON Content-Type of the encoded request body.
+
+    Returns:
+        str | None: The snapshot ID of the playlist after the last batch was added, or None if
+        there were no tracks to add.
 
     Raises:
         HTTPException: If the Spotify API request fails, an HTTPException is raised with the
         status code and error details from the response.
     """
     url = f"{config['SPOTIFY_API_URL']}/playlists/{playlist_id}/tracks"
-    track_uris = [f"spotify:track:{track_id}" for track_id in track_ids]
-    payload = {"uris": track_uris}
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, headers=spotify_headers, json=payload)
+    track_uris = [SPOTIFY_TRACK_URI_PREFIX + track_id for track_id in track_ids]
+    snapshot_id = None
+    for index in range(0, len(track_uris), ADD_TRACKS_BATCH_SIZE):
+        payload = orjson.dumps({"uris": track_uris[index : index + ADD_TRACKS_BATCH_SIZE]})
+        response = await send_with_rate_limit_retry(
+            lambda: get_http_client().post(url, headers=spotify_headers, content=payload)
+        )
         response.raise_for_status()
+        snapshot_id = orjson.loads(response.content).get("snapshot_id")
+    return snapshot_id
+
+
+def get_playlist_tracks_cache_key(spotify_id: str, snapshot_id: str | None = None) -> str:
+    """
+    Build the cache key under which the track titles of a playlist are stored.
 
+    Args:
+        spotify_id (str): The Spotify ID of the playlist.
+        snapshot_id (str | None): The snapshot ID of the playlist's current version, if known.
 
-async def cache_playlist_tracks(playlists: list[dict], db_session: Session) -> dict[str, set]:
+    Returns:
+        str: The cache key for the playlist's tracks.
+    """
+    if snapshot_id:
+        return f"playlist:{spotify_id}:{snapshot_id}:tracks"
+    return f"playlist:{spotify_id}:tracks"
+
+
+async def cache_playlist_tracks(
+    playlists: list[dict], db_session: Session, spotify_headers: dict[str, str] | None = None
+) -> dict[str, set]:
     """
     Fetch all tracks for each playlist and store them in a cache (Redis).
+    Cache entries are keyed by the playlist's snapshot ID, so a playlist whose contents changed
+    on Spotify is fetched again instead of being served from a stale entry.
 
     Args:
         playlists (list[dict]): List of dictonaries containing the playlists details.
         db_session (Session): The SQLAlchemy session to interact with the database.
+        spotify_headers (dict[str, str] | None): Already resolved headers for the Spotify API
+            requests. If not provided, they are retrieved using the current access token.
 
     Returns:
         dict[str, set]: A dictionary with playlist IDs as keys and sets of track titles as values.
     """
-    playlist_tracks_cache = {}
-    spotify_headers = await get_spotify_headers(db_session)
-    redis_client = Redis(
-        url=config["REDIS_URL"],
-        token=config["REDIS_TOKEN"],
-    )
+    playlists_by_id = {playlist["id"]: playlist for playlist in playlists}
+    if not playlists_by_id:
+        return {}
+    spotify_ids = list(playlists_by_id)
+    cache_keys = [
+        get_playlist_tracks_cache_key(spotify_id, playlists_by_id[spotify_id].get("snapshot_id"))
+        for spotify_id in spotify_ids
+    ]
+    spotify_headers = spotify_headers or await get_spotify_headers(db_session)
+    redis_client = get_redis_client()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SPOTIFY_REQUESTS)
+
+    async def get_spotify_json(url: str, params: dict) -> dict:
+        """
+        Send a GET request to the Spotify API and return the decoded response.
+        If Spotify rate limits the request, it is retried with a backoff.
+
+        Args:
+            url (str): The Spotify API URL to request.
+            params (dict): The query parameters of the request.
+
+        Returns:
+            dict: The JSON response from Spotify.
 
-    async def fetch_tracks(playlist: dict):
+        Raises:
+            httpx.HTTPStatusError: If the request to the Spotify API fails.
         """
-        Fetch tracks for a given playlist from the Spotify API.
+        async with semaphore:
+            response = await send_with_rate_limit_retry(
+                lambda: get_http_client().get(url, headers=spotify_headers, params=params)
+            )
+        response.raise_for_status()
+        return orjson.loads(response.content)
 
-        This inner asynchronous function retrieves track information for a
-        specific playlist identified by its Spotify ID and updates the
-        `playlist_tracks_cache` with the track names.
+    async def fetch_tracks(spotify_id: str, total: int | None = None) -> set[str]:
+        """
+        Fetch tracks for a given playlist from the Spotify API.
+        If the total number of tracks is already known from the playlists listing, all pages are
+        fetched concurrently right away. Otherwise the first page reports the total number of
+        tracks and the remaining pages are fetched concurrently.
 
         Args:
-            playlist (dict): A dictionary containing the details of the playlist.
+            spotify_id (str): The Spotify ID of the playlist.
+            total (int | None): The number of tracks in the playlist, if known.
+
+        Returns:
+            set[str]: A set of track titles included in the playlist.
 
         Raises:
             httpx.HTTPStatusError: If the request to the Spotify API fails.
         """
-        spotify_id = playlist["uri"].split(":")[-1]
-        cache_key = f"playlist:{spotify_id}:tracks"
-        cached_tracks = await redis_client.get(cache_key)
-        if cached_tracks:
-            playlist_tracks_cache[spotify_id] = set(cached_tracks.split(","))
-            return
-
-        async with httpx.AsyncClient() as client:
-            url = f"{config['SPOTIFY_API_URL']}/playlists/{spotify_id}"
-            response = await client.get(url, headers=spotify_headers)
-            response.raise_for_status()
-            playlist_details = response.json()["tracks"]["items"]
-            tracks = {item["track"]["name"] for item in playlist_details}
-            await redis_client.set(cache_key, ",".join(tracks), ex=3600)
+        url = f"{config['SPOTIFY_API_URL']}/playlists/{spotify_id}/tracks"
+        limit = PLAYLIST_TRACKS_PAGE_LIMIT
+        items = []
+        start = 0
+        if total is None:
+            first_page = await get_spotify_json(
+                url, {"limit": limit, "fields": PLAYLIST_TRACKS_FIELDS}
+            )
+            items = first_page["items"]
+            total = first_page.get("total", len(items))
+            start = limit
+        pages = await gather_or_cancel(
+            *[
+                get_spotify_json(
+                    url, {"offset": offset, "limit": limit, "fields": PLAYLIST_TRACKS_FIELDS}
+                )
+                for offset in range(start, total, limit)
+            ]
+        )
+        for page in pages:
+            items.extend(page["items"])
+        return {track["name"] for item in items if (track := item["track"])}
+
+    cached_tracks = await redis_client.mget(*cache_keys)
+    playlist_tracks_cache = {
+        spotify_id: set(orjson.loads(cached))
+        for spotify_id, cached in zip(spotify_ids, cached_tracks)
+        if cached is not None
+    }
+    missing = [
+        (spotify_id, cache_key)
+        for spotify_id, cache_key, cached in zip(spotify_ids, cache_keys, cached_tracks)
+        if cached is None
+    ]
+    if missing:
+        fetched_tracks = await gather_or_cancel(
+            *[
+                fetch_tracks(spotify_id, playlists_by_id[spotify_id].get("tracks", {}).get("total"))
+                for spotify_id, _ in missing
+            ]
+        )
+        pipeline = redis_client.pipeline()
+        for (spotify_id, cache_key), tracks in zip(missing, fetched_tracks):
+            pipeline.set(
+                cache_key, orjson.dumps(list(tracks)).decode(), ex=PLAYLIST_TRACKS_CACHE_TTL
+            )
             playlist_tracks_cache[spotify_id] = tracks
-
-    await asyncio.gather(*[fetch_tracks(playlist) for playlist in playlists])
-    await redis_client.close()
+        await pipeline.exec()
     return playlist_tracks_cache
@@ -0,0 +1,31 @@
+from upstash_redis.asyncio import Redis
+
+from app.services.utils import config
+
+_redis_client: Redis | None = None
+
+
+def get_redis_client() -> Redis:
+    """
+    Retrieve the application-wide Redis client, creating it on first use.
+
+    The client keeps its HTTP session to Upstash open, so subsequent cache operations
+    reuse already established connections instead of opening new ones.
+
+    Returns:
+        Redis: The shared asynchronous Upstash Redis client.
+    """
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = Redis(url=config["REDIS_URL"], token=config["REDIS_TOKEN"])
+    return _redis_client
+
+
+async def close_redis_client() -> None:
+    """
+    Close the application-wide Redis client and release its connections.
+    """
+    global _redis_client
+    if _redis_client is not None:
+        await _redis_client.close()
+        _redis_client = None
@@ -1,18 +1,32 @@
+import asyncio
 from time import time
 
 import httpx
+import orjson
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.db.models import AccessToken
+from app.services.http_client import get_http_client
 from app.services.utils import config
 
+TOKEN_CACHE_EXPIRY_MARGIN = 30
+
+_cached_token: dict[str, str | float] | None = None
+_token_refresh_lock = asyncio.Lock()
+
 
 class RefreshTokenError(Exception):
     """Custom exception for refresh token-related errors."""
 
 
-def save_token(access_token: str, refresh_token: str, expires_in: int, db_session: Session):
+def save_token(
+    access_token: str,
+    refresh_token: str,
+    expires_in: int,
+    db_session: Session,
+    token: AccessToken | None = None,
+):
     """
     Save or update the access and refresh tokens in the database.
 
@@ -21,9 +35,12 @@ def save_token(access_token: str, refresh_token: str, expires_in: int, db_sessio
         refresh_token (str): The refresh token.
         expires_in (int): Time in seconds until the access token expires.
         db_session (Session): The SQLAlchemy session to interact with the database.
+        token (AccessToken | None): The already loaded token to update. If not provided, it is
+            retrieved from the database.
     """
+    global _cached_token
     expires_at = time() + expires_in
-    token = db_session.query(AccessToken).first()
+    token = token or db_session.query(AccessToken).first()
     if token:
         token.access_token = access_token
         token.refresh_token = refresh_token
@@ -36,11 +53,19 @@ def save_token(access_token: str, refresh_token: str, expires_in: int, db_sessio
         )
         db_session.add(token)
     db_session.commit()
+    _cached_token = {
+        "access_token": access_token,
+        "refresh_token": refresh_token,
+        "expires_at": expires_at,
+    }
 
 
 async def get_token(db_session: Session) -> dict[str, str]:
     """
     Retrieve the current access token if it is still valid, or refresh it.
+    A token read or saved earlier is served from memory until it is about to expire, so the
+    database is not queried for every Spotify request. Concurrent callers finding an expired
+    token wait for a single refresh instead of each refreshing it on their own.
 
     Args:
         db_session (Session): The SQLAlchemy session to interact with the database.
@@ -51,14 +76,39 @@ async def get_token(db_session: Session) -> dict[str, str]:
     Raises:
         HTTPException: If the token does not exist or refresh fails.
     """
-    token = get_token_from_db(db_session)
-    if not is_token_expired(token):
-        return {
-            "access_token": token.access_token,
-            "refresh_token": token.refresh_token,
-            "expires_at": token.expires_at,
-        }
-    return await handle_token_refresh(token.refresh_token, db_session)
+    global _cached_token
+    if is_cached_token_valid():
+        return _cached_token
+    async with _token_refresh_lock:
+        if is_cached_token_valid():
+            return _cached_token
+        token = get_token_from_db(db_session)
+        if not is_token_expired(token):
+            _cached_token = {
+                "access_token": token.access_token,
+                "refresh_token": token.refresh_token,
+                "expires_at": token.expires_at,
+            }
+            return _cached_token
+        return await handle_token_refresh(token.refresh_token, db_session, token)
+
+
+def is_cached_token_valid() -> bool:
+    """
+    Check if the access token kept in memory exists and is not about to expire.
+
+    Returns:
+        bool: True if the cached token can be used, False otherwise.
+    """
+    return bool(_cached_token and _cached_token["expires_at"] - time() > TOKEN_CACHE_EXPIRY_MARGIN)
+
+
+def clear_token_cache() -> None:
+    """
+    Drop the access token kept in memory, so the next lookup reads it from the database.
+    """
+    global _cached_token
+    _cached_token = None
 
 
 def get_token_from_db(db_session: Session) -> AccessToken:
@@ -96,13 +146,16 @@ def is_token_expired(token: AccessToken) -> bool:
     return token.expires_at < time()
 
 
-async def handle_token_refresh(refresh_token: str, db_session: Session) -> dict[str, str]:
+async def handle_token_refresh(
+    refresh_token: str, db_session: Session, token: AccessToken | None = None
+) -> dict[str, str]:
     """
     Handle the token refresh process.
 
     Args:
         refresh_token (str): The refresh token used to get a new access token.
         db_session (Session): The SQLAlchemy session to interact with the database.
+        token (AccessToken | None): The already loaded token to update with the refreshed data.
 
     Returns:
         dict[str, str]: The refreshed token data.
@@ -111,20 +164,24 @@ async def handle_token_refresh(refresh_token: str, db_session: Session) -> dict[
         HTTPException: If the refresh process fails.
     """
     try:
-        return await refresh_access_token(refresh_token, db_session)
+        return await refresh_access_token(refresh_token, db_session, token)
     except RefreshTokenError as exc:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail=f"Token refresh failed: {str(exc)}"
         ) from exc
 
 
-async def refresh_access_token(refresh_token: str, db_session: Session) -> dict[str, str]:
+async def refresh_access_token(
+    refresh_token: str, db_session: Session, token: AccessToken | None = None
+) -> dict[str, str]:
     """
     Refresh the access token using the refresh token.
 
     Args:
         refresh_token (str): The refresh token used to get a new access token.
         db_session (Session): The SQLAlchemy session to interact with the database.
+        token (AccessToken | None): The already loaded token to update with the refreshed data.
+            If not provided, it is retrieved from the database when saving.
 
     Returns:
         dict[str, str]: A dictionary containing the refreshed token data.
@@ -132,34 +189,33 @@ async def refresh_access_token(refresh_token: str, db_session: Session) -> dict[
     Raises:
         RefreshTokenError: If the refresh token is invalid or an unexpected error occurs.
     """
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(
-                config["SPOTIFY_TOKEN_URL"],
-                data={
-                    "grant_type": "refresh_token",
-                    "refresh_token": refresh_token,
-                    "client_id": config["CLIENT_ID"],
-                    "client_secret": config["CLIENT_SECRET"],
-                },
-            )
-            response.raise_for_status()
-            token_data = response.json()
-            new_token = {
-                "access_token": token_data["access_token"],
+    try:
+        response = await get_http_client().post(
+            config["SPOTIFY_TOKEN_URL"],
+            data={
+                "grant_type": "refresh_token",
                 "refresh_token": refresh_token,
-                "expires_at": token_data.get("expires_in", 3600),
-            }
-            save_token(*new_token.values(), db_session)
-            return new_token
-        except httpx.HTTPStatusError as exc:
-            raise RefreshTokenError(
-                f"Failed to refresh token: {exc.response.status_code} - {exc.response.text}"
-            ) from exc
-        except httpx.TimeoutException as exc:
-            raise RefreshTokenError("Request timed out while refreshing token") from exc
-        except Exception as exc:
-            raise RefreshTokenError(f"Unexpected error: {str(exc)}") from exc
+                "client_id": config["CLIENT_ID"],
+                "client_secret": config["CLIENT_SECRET"],
+            },
+        )
+        response.raise_for_status()
+        token_data = orjson.loads(response.content)
+        new_token = {
+            "access_token": token_data["access_token"],
+            "refresh_token": refresh_token,
+            "expires_at": token_data.get("expires_in", 3600),
+        }
+        save_token(*new_token.values(), db_session, token)
+        return new_token
+    except httpx.HTTPStatusError as exc:
+        raise RefreshTokenError(
+            f"Failed to refresh token: {exc.response.status_code} - {exc.response.text}"
+        ) from exc
+    except httpx.TimeoutException as exc:
+        raise RefreshTokenError("Request timed out while refreshing token") from exc
+    except Exception as exc:
+        raise RefreshTokenError(f"Unexpected error: {str(exc)}") from exc
 
 
 async def get_spotify_headers(db_session: Session) -> dict[str, str]:
@@ -1,12 +1,27 @@
 import asyncio
+import time
+from weakref import WeakValueDictionary
 
 import httpx
+import orjson
 from app.db.models import Track, UserPollingStatus
+from app.services.http_client import get_http_client, send_with_rate_limit_retry
 from app.services.token_manager import get_spotify_headers
 from app.services.user_auth_service import get_current_user_id, is_user_authorized
 from app.services.utils import config
 from fastapi import BackgroundTasks, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only, raiseload
+
+PLAYBACK_STATE_CACHE_TTL = 2.0
+SONG_CHANGE_GRACE_PERIOD = 0.5
+SONG_CHANGE_POLL_INTERVAL = 2
+SONG_CHANGE_MAX_POLLS = 10
+POLLING_INTERVAL = 1
+POLLING_STATUS_CHECK_INTERVAL = 60
+
+_polling_locks: WeakValueDictionary[str, asyncio.Lock] = WeakValueDictionary()
+_polling_stop_events: dict[str, asyncio.Event] = {}
+_playback_state_cache: tuple[str, float, dict, str | None] | None = None
 
 
 async def get_current_track(db_session: Session) -> dict:
@@ -24,38 +39,70 @@ async def get_current_track(db_session: Session) -> dict:
     """
     url = f"{config['SPOTIFY_API_URL']}/me/player/currently-playing"
     headers = await get_spotify_headers(db_session)
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(url, headers=headers)
-            response.raise_for_status()
-        except httpx.HTTPStatusError as exc:
-            raise HTTPException(
-                status_code=exc.response.status_code,
-                detail=f"Failed to fetch current track: {exc.response.text}",
-            ) from exc
-        except httpx.RequestError as exc:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail=f"Error connecting to Spotify API: {str(exc)}",
-            ) from exc
-        return response.json()
+    try:
+        response = await send_with_rate_limit_retry(
+            lambda: get_http_client().get(url, headers=headers)
+        )
+        response.raise_for_status()
+    except httpx.HTTPStatusError as exc:
+        raise HTTPException(
+            status_code=exc.response.status_code,
+            detail=f"Failed to fetch current track: {exc.response.text}",
+        ) from exc
+    except httpx.RequestError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Error connecting to Spotify API: {str(exc)}",
+        ) from exc
+    return orjson.loads(response.content)
 
 
 async def poll_playback_state(db_session: Session) -> None:
     """
     Poll the playback state periodically in the background and handle the current playing track.
 
+    Polling stops as soon as the user's stop event is set, including while waiting for a song
+    to end. The polling status stored in the database is only checked every 60th iteration,
+    as a fallback for stops the event missed.
+
     Args:
         db_session (Session): The SQLAlchemy session to interact with the database.
     """
     user_id = await get_current_user_id(db_session)
-    continue_polling = True
-    while continue_polling:
+    stop_event = _polling_stop_events.setdefault(user_id, asyncio.Event())
+    iteration = 0
+    while not stop_event.is_set():
         state = await get_playback_state(db_session)
-        await handle_playing_track(state, db_session)
-        current_user_polling_status = await get_user_polling_status(user_id, db_session)
-        continue_polling = current_user_polling_status.is_polling
-        await asyncio.sleep(1)
+        await handle_playing_track(state, db_session, stop_event)
+        iteration += 1
+        if iteration % POLLING_STATUS_CHECK_INTERVAL == 0:
+            if not await is_user_polling(user_id, db_session):
+                break
+        await sleep_until_stopped(POLLING_INTERVAL, stop_event)
+    if _polling_stop_events.get(user_id) is stop_event:
+        del _polling_stop_events[user_id]
+
+
+async def sleep_until_stopped(seconds: float, stop_event: asyncio.Event | None = None) -> bool:
+    """
+    Sleep for the given time, or less if the stop event is set in the meantime.
+
+    Args:
+        seconds (float): The time to sleep in seconds.
+        stop_event (asyncio.Event | None, optional): The event ending the sleep early.
+            Defaults to None.
+
+    Returns:
+        bool: True if the sleep was ended by the stop event, False if the whole time passed.
+    """
+    if stop_event is None:
+        await asyncio.sleep(seconds)
+        return False
+    try:
+        await asyncio.wait_for(stop_event.wait(), timeout=seconds)
+    except asyncio.TimeoutError:
+        return False
+    return True
 
 
 async def get_recently_played_tracks(db_session: Session, limit: int = 1) -> dict:
@@ -72,29 +119,36 @@ async def get_recently_played_tracks(db_session: Session, limit: int = 1) -> dic
     Raises:
         HTTPException: If the request to Spotify fails or returns a non-200 status code.
     """
-    url = f"{config['SPOTIFY_API_URL']}/me/player/recently-played?limit={limit}"
+    url = f"{config['SPOTIFY_API_URL']}/me/player/recently-played"
     headers = await get_spotify_headers(db_session)
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(url, headers=headers)
-            response.raise_for_status()
-        except httpx.HTTPStatusError as exc:
-            raise HTTPException(
-                status_code=exc.response.status_code,
-                detail=f"Failed to fetch recently played tracks: {exc.response.text}",
-            ) from exc
-        except httpx.RequestError as exc:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail=f"Error connecting to Spotify API: {str(exc)}",
-            ) from exc
-        return response.json()
+    try:
+        response = await send_with_rate_limit_retry(
+            lambda: get_http_client().get(url, headers=headers, params={"limit": limit})
+        )
+        response.raise_for_status()
+    except httpx.HTTPStatusError as exc:
+        raise HTTPException(
+            status_code=exc.response.status_code,
+            detail=f"Failed to fetch recently played tracks: {exc.response.text}",
+        ) from exc
+    except httpx.RequestError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Error connecting to Spotify API: {str(exc)}",
+        ) from exc
+    return orjson.loads(response.content)
 
 
 async def get_playback_state(db_session: Session) -> dict:
     """
     Retrieve the user's current playback state from Spotify.
 
+    The latest response is cached for a couple of seconds, so polls following each other closely
+    are answered without sending another request to Spotify. The application holds a single
+    access token at a time, so only one response is kept, and it is not reused once the token
+    changes. Once the cached response is stale, its ETag is sent in the If-None-Match header,
+    and a 304 Not Modified response reuses the cached state instead of decoding a new one.
+
     Args:
         db_session (Session): The SQLAlchemy session to interact with the database.
 
@@ -106,37 +160,75 @@ async def get_playback_state(db_session: Session) -> dict:
     """
     url = f"{config['SPOTIFY_API_URL']}/me/player"
     headers = await get_spotify_headers(db_session)
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(url, headers=headers)
+    global _playback_state_cache
+    authorization = headers["Authorization"]
+    cached = _playback_state_cache
+    if cached and cached[0] != authorization:
+        cached = None
+    if cached and time.monotonic() - cached[1] < PLAYBACK_STATE_CACHE_TTL:
+        return cached[2]
+    request_headers = headers
+    if cached and cached[3]:
+        request_headers = {**headers, "If-None-Match": cached[3]}
+    try:
+        response = await send_with_rate_limit_retry(
+            lambda: get_http_client().get(url, headers=request_headers)
+        )
+        if response.status_code != httpx.codes.NOT_MODIFIED:
             response.raise_for_status()
-        except httpx.HTTPStatusError as exc:
-            raise HTTPException(
-                status_code=exc.response.status_code,
-                detail=f"Failed to fetch playback state: {exc.response.text}",
-            ) from exc
-        except httpx.RequestError as exc:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail=f"Error connecting to Spotify API: {str(exc)}",
-            ) from exc
-        return response.json()
+    except httpx.HTTPStatusError as exc:
+        raise HTTPException(
+            status_code=exc.response.status_code,
+            detail=f"Failed to fetch playback state: {exc.response.text}",
+        ) from exc
+    except httpx.RequestError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Error connecting to Spotify API: {str(exc)}",
+        ) from exc
+    if response.status_code == httpx.codes.NOT_MODIFIED:
+        state = cached[2]
+        etag = response.headers.get("ETag", cached[3])
+    else:
+        state = orjson.loads(response.content)
+        etag = response.headers.get("ETag")
+    _playback_state_cache = (authorization, time.monotonic(), state, etag)
+    return state
 
 
-async def handle_playing_track(state: dict, db_session: Session) -> None:
+def clear_playback_state_cache() -> None:
+    """
+    Drop the cached playback state, so the next call to Spotify is not answered from the cache.
+    """
+    global _playback_state_cache
+    _playback_state_cache = None
+
+
+async def handle_playing_track(
+    state: dict, db_session: Session, stop_event: asyncio.Event | None = None
+) -> None:
     """
     Handle the logic for the currently playing track, updating the database as necessary.
 
     Args:
         state (dict): The current playback state returned from Spotify.
         db_session (Session): The SQLAlchemy session to interact with the database.
+        stop_event (asyncio.Event | None, optional): The stop event of the polling session.
+            Defaults to None.
     """
     progress, duration, track_title, track_id = extract_track_data(state)
     ten_seconds_passed, ten_seconds_left = check_track_progress(progress, duration)
-    track_db = get_track_from_db(db_session, track_title)
+    track_db = get_track_from_db(db_session, track_id)
     if state.get("is_playing"):
         await process_playing_track(
-            track_db, ten_seconds_passed, ten_seconds_left, track_title, track_id, db_session
+            track_db,
+            ten_seconds_passed,
+            ten_seconds_left,
+            track_title,
+            track_id,
+            db_session,
+            remaining_ms=duration - progress,
+            stop_event=stop_event,
         )
 
 
@@ -182,18 +274,23 @@ def check_track_progress(progress: int, duration: int) -> tuple[bool, bool]:
     return ten_seconds_passed, ten_seconds_left
 
 
-def get_track_from_db(db_session: Session, track_title: str) -> Track | None:
+def get_track_from_db(db_session: Session, track_id: str) -> Track | None:
     """
-    Query the database for a track by its title.
+    Query the database for a track by its Spotify ID.
+    Only the columns needed to count a listen are loaded.
 
     Args:
         db_session (Session): The SQLAlchemy session to interact with the database.
-        track_title (str): The title of the track to search for.
+        track_id (str): The Spotify ID of the track to search for.
 
     Returns:
         Track | None: The Track object if found, otherwise None.
     """
-    track_query = db_session.query(Track).filter_by(title=track_title)
+    track_query = (
+        db_session.query(Track)
+        .options(load_only(Track.id, Track.title))
+        .filter_by(spotify_id=track_id)
+    )
     return track_query.first()
 
 
@@ -204,6 +301,8 @@ async def process_playing_track(
     track_title: str,
     track_id: str,
     db_session: Session,
+    remaining_ms: int = 0,
+    stop_event: asyncio.Event | None = None,
 ) -> None:
     """
     Process the currently playing track by updating its listen count or creating a new entry in the database.
@@ -215,9 +314,13 @@ async def process_playing_track(
         track_title (str): The title of the currently playing track.
         track_id (str): The Spotify ID of the currently playing track.
         db_session (Session): The SQLAlchemy session to interact with the database.
+        remaining_ms (int, optional): The time left until the track ends in milliseconds.
+            Defaults to 0.
+        stop_event (asyncio.Event | None, optional): The stop event of the polling session.
+            Defaults to None.
     """
     if track_db and ten_seconds_left:
-        await update_track_listened_count(track_db, db_session)
+        await update_track_listened_count(track_db, db_session, remaining_ms, stop_event)
     elif not track_db and ten_seconds_passed:
         await create_track_entry(track_title, track_id, db_session)
 
@@ -236,33 +339,65 @@ async def create_track_entry(track_title: str, track_id: str, db_session: Sessio
     db_session.commit()
 
 
-async def update_track_listened_count(track: Track, db_session: Session) -> None:
+async def update_track_listened_count(
+    track: Track,
+    db_session: Session,
+    remaining_ms: int = 0,
+    stop_event: asyncio.Event | None = None,
+) -> None:
     """
     Update the listened count for an existing track in the database.
 
+    The count is incremented by the database in a single UPDATE, so concurrent listens are not
+    lost, and the track title is read before committing, so the expired track is not reloaded.
+
     Args:
         track (Track): The track object to update.
         db_session (Session): The SQLAlchemy session to interact with the database.
-    """
-    track.listened_count += 1
+        remaining_ms (int, optional): The time left until the track ends in milliseconds.
+            Defaults to 0.
+        stop_event (asyncio.Event | None, optional): The stop event of the polling session.
+            Defaults to None.
+    """
+    track_title = track.title
+    db_session.query(Track).filter_by(id=track.id).update(
+        {"listened_count": Track.listened_count + 1}, synchronize_session=False
+    )
     db_session.commit()
-    await wait_for_song_change(track.title, db_session)
+    clear_playback_state_cache()
+    await wait_for_song_change(track_title, db_session, remaining_ms, stop_event)
 
 
-async def wait_for_song_change(current_track_title: str, db_session: Session) -> None:
+async def wait_for_song_change(
+    current_track_title: str,
+    db_session: Session,
+    remaining_ms: int = 0,
+    stop_event: asyncio.Event | None = None,
+) -> None:
     """
-    Continuously check if the current song has changed, and wait until it does.
+    Wait until the current song ends, then check if the song has changed.
+
+    The playback state is not requested before the remaining time of the track has passed.
+    Afterwards it is checked a limited number of times, so a paused or repeated track
+    does not keep the caller waiting forever. Setting the stop event ends the wait right away.
 
     Args:
         current_track_title (str): The title of the currently playing track.
         db_session (Session): The SQLAlchemy session to interact with the database.
-    """
-    while True:
+        remaining_ms (int, optional): The time left until the track ends in milliseconds.
+            Defaults to 0.
+        stop_event (asyncio.Event | None, optional): The stop event of the polling session.
+            Defaults to None.
+    """
+    if await sleep_until_stopped(remaining_ms / 1000 + SONG_CHANGE_GRACE_PERIOD, stop_event):
+        return
+    for _ in range(SONG_CHANGE_MAX_POLLS):
         state = await get_playback_state(db_session)
         new_track_title = state["item"]["name"]
         if new_track_title != current_track_title:
             break
-        await asyncio.sleep(1)
+        if await sleep_until_stopped(SONG_CHANGE_POLL_INTERVAL, stop_event):
+            break
 
 
 async def update_polling_status(
@@ -273,6 +408,9 @@ async def update_polling_status(
 
     If a `user_id` is provided, the function updates or creates the polling status for that user.
     If no `user_id` is provided, the function updates the polling status for all users.
+    Existing statuses are updated with a single UPDATE statement without loading them first.
+    Disabling polling also sets the stop events of the affected polling loops, so they end
+    right away instead of at their next database check.
 
     Args:
         db_session (Session): The SQLAlchemy session to interact with the database.
@@ -280,35 +418,60 @@ async def update_polling_status(
         user_id (int, optional): The ID of the user to update. If None, updates all users.
     """
     if user_id:
-        user_polling_status = db_session.query(UserPollingStatus).filter_by(user_id=user_id).first()
-
-        if not user_polling_status:
-            user_polling_status = UserPollingStatus(user_id=user_id)
-            db_session.add(user_polling_status)
-
-        user_polling_status.is_polling = enable
+        updated_rows = (
+            db_session.query(UserPollingStatus)
+            .filter_by(user_id=user_id)
+            .update({"is_polling": enable})
+        )
+        if not updated_rows:
+            db_session.add(UserPollingStatus(user_id=user_id, is_polling=enable))
     else:
         db_session.query(UserPollingStatus).update({"is_polling": enable})
     db_session.commit()
+    if enable and user_id:
+        _polling_stop_events[user_id] = asyncio.Event()
+    elif not enable:
+        for polling_user_id, stop_event in _polling_stop_events.items():
+            if not user_id or polling_user_id == user_id:
+                stop_event.set()
 
 
-async def get_user_polling_status(user_id: int, db_session: Session) -> UserPollingStatus:
+async def is_user_polling(user_id: int, db_session: Session) -> bool:
     """
-    Retrieve the polling status for the currently logged-in user.
+    Check whether polling is active for the currently logged-in user.
+    Only the polling flag is selected, the polling status record itself is not loaded.
 
     Args:
         user_id (int): The user ID to get the polling status of.
         db_session (Session): The SQLAlchemy session to interact with the database.
 
     Returns:
-        UserPollingStatus: The polling status record for the user, or None if it does not exist.
+        bool: True if polling is active for the user, False if it is not or was never started.
     """
-    return db_session.query(UserPollingStatus).filter_by(user_id=user_id).first()
+    is_polling = db_session.query(UserPollingStatus.is_polling).filter_by(user_id=user_id).scalar()
+    return bool(is_polling)
+
+
+def has_listened_tracks(db_session: Session) -> bool:
+    """
+    Check whether any track has been listened to, without loading the tracks.
+
+    Args:
+        db_session (Session): The SQLAlchemy session to interact with the database.
+
+    Returns:
+        bool: True if at least one track has a listened count greater than zero.
+    """
+    listened_tracks = db_session.query(Track).filter(Track.listened_count > 0)
+    return db_session.query(listened_tracks.exists()).scalar()
 
 
 def fetch_listened_tracks(db_session: Session) -> list[Track]:
     """
     Fetch tracks from the database that have been listened to (i.e., have a nonzero listened count).
+    Only the columns needed to build a playlist are loaded. Relationships of the returned tracks
+    are not loadable, so an accidental lazy load per track raises instead of silently issuing
+    one query per track.
 
     Args:
         db_session (Session): The SQLAlchemy session to interact with the database.
@@ -319,7 +482,12 @@ def fetch_listened_tracks(db_session: Session) -> list[Track]:
     Returns:
         list[Track]: A list of tracks with a listened count greater than zero.
     """
-    tracks_db = db_session.query(Track).filter(Track.listened_count > 0).all()
+    tracks_db = (
+        db_session.query(Track)
+        .options(load_only(Track.id, Track.spotify_id, Track.title), raiseload("*"))
+        .filter(Track.listened_count > 0)
+        .all()
+    )
     if not tracks_db:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -328,6 +496,21 @@ def fetch_listened_tracks(db_session: Session) -> list[Track]:
     return tracks_db
 
 
+def get_polling_lock(user_id: str) -> asyncio.Lock:
+    """
+    Retrieve the lock serializing starts and stops of the user's polling session.
+    The lock is only kept while a request holds or waits for it, so locks of users who no longer
+    start or stop polling do not accumulate.
+
+    Args:
+        user_id (str): The user ID to get the lock for.
+
+    Returns:
+        asyncio.Lock: The polling lock of the user.
+    """
+    return _polling_locks.setdefault(user_id, asyncio.Lock())
+
+
 async def start_polling_tracks(
     background_tasks: BackgroundTasks, db_session: Session
 ) -> dict[str, str]:
@@ -345,18 +528,19 @@ async def start_polling_tracks(
          HTTPException: User is not authorized or polling is already active.
     """
     user_id = await get_current_user_id(db_session)
-    current_user_polling_status = await get_user_polling_status(user_id, db_session)
-    if current_user_polling_status.is_polling:
-        raise HTTPException(
-            status.HTTP_409_CONFLICT,
-            "The polling session for current user has been already started.",
-        )
-    if is_user_authorized(db_session):
-        await update_polling_status(db_session, enable=True, user_id=user_id)
-        background_tasks.add_task(poll_playback_state, db_session)
-        return {"message": "Playback state polling started in the background."}
+    async with get_polling_lock(user_id):
+        if await is_user_polling(user_id, db_session):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="The polling session for current user has been already started.",
+            )
+        if is_user_authorized(db_session):
+            await update_polling_status(db_session, enable=True, user_id=user_id)
+            background_tasks.add_task(poll_playback_state, db_session)
+            return {"message": "Playback state polling started in the background."}
     raise HTTPException(
-        status.HTTP_401_UNAUTHORIZED, "Unauthorized - to start the polling you have to login first."
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Unauthorized - to start the polling you have to login first.",
     )
 
 
@@ -375,16 +559,16 @@ async def stop_polling_tracks(db_session: Session) -> dict[str, str]:
         HTTPException: User is not authorized or polling is not active.
     """
     user_id = await get_current_user_id(db_session)
-    current_user_polling_status = await get_user_polling_status(user_id, db_session)
-    if not current_user_polling_status.is_polling:
-        raise HTTPException(
-            status.HTTP_409_CONFLICT,
-            "The polling session for current user was not started.",
-        )
-    if is_user_authorized(db_session):
-        await update_polling_status(db_session, enable=False, user_id=user_id)
-        return {"message": "Polling session has been stopped successfully"}
+    async with get_polling_lock(user_id):
+        if not await is_user_polling(user_id, db_session):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="The polling session for current user was not started.",
+            )
+        if is_user_authorized(db_session):
+            await update_polling_status(db_session, enable=False, user_id=user_id)
+            return {"message": "Polling session has been stopped successfully"}
     raise HTTPException(
-        status.HTTP_401_UNAUTHORIZED,
-        "Unauthorized - to stop polling you have to login first.",
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Unauthorized - to stop polling you have to login first.",
     )
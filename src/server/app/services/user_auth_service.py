@@ -2,20 +2,26 @@ import base64
 import urllib.parse
 
 import httpx
+import orjson
 from fastapi import HTTPException, status
 from fastapi.responses import RedirectResponse
 from sqlalchemy.orm import Session
 
+from app.services.http_client import get_http_client, send_with_rate_limit_retry
 from app.services.token_manager import get_spotify_headers, get_token_from_db, save_token
 from app.services.utils import config, generate_random_string
 
 
-async def get_current_user(db_session: Session) -> dict:
+async def get_current_user(
+    db_session: Session, spotify_headers: dict[str, str] | None = None
+) -> dict:
     """
     Retrieve the current user's Spotify profile information.
 
     Args:
         db_session (Session): The SQLAlchemy session to interact with the database.
+        spotify_headers (dict[str, str] | None): Already resolved headers for the Spotify API
+            request. If not provided, they are retrieved using the current access token.
 
     Returns:
         dict: A dictionary containing the current user's profile information.
@@ -24,23 +30,26 @@ async def get_current_user(db_session: Session) -> dict:
         HTTPException: If the user data cannot be retrieved from Spotify.
     """
     url = f"{config['SPOTIFY_API_URL']}/me"
-    headers = await get_spotify_headers(db_session)
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=headers)
-        if response.status_code == status.HTTP_200_OK:
-            return response.json()
-        raise HTTPException(
-            status_code=response.status_code,
-            detail=f"Failed to fetch user data: {response.text}",
-        )
+    headers = spotify_headers or await get_spotify_headers(db_session)
+    response = await send_with_rate_limit_retry(lambda: get_http_client().get(url, headers=headers))
+    if response.status_code == status.HTTP_200_OK:
+        return orjson.loads(response.content)
+    raise HTTPException(
+        status_code=response.status_code,
+        detail=f"Failed to fetch user data: {response.text}",
+    )
 
 
-async def get_current_user_id(db_session: Session) -> str:
+async def get_current_user_id(
+    db_session: Session, spotify_headers: dict[str, str] | None = None
+) -> str:
     """
     Retrieve the current user's Spotify user ID.
 
     Args:
         db_session (Session): The SQLAlchemy session to interact with the database.
+        spotify_headers (dict[str, str] | None): Already resolved headers for the Spotify API
+            request. If not provided, they are retrieved using the current access token.
 
     Returns:
         str: The current user's Spotify user ID.
@@ -48,7 +57,7 @@ async def get_current_user_id(db_session: Session) -> str:
     Raises:
         HTTPException: If the user ID is missing or cannot be retrieved.
     """
-    current_user = await get_current_user(db_session)
+    current_user = await get_current_user(db_session, spotify_headers)
     current_user_id = current_user.get("id")
     if not current_user_id:
         raise HTTPException(
@@ -157,10 +166,9 @@ async def exchange_token_with_spotify(form_data: dict, headers: dict) -> dict[st
         HTTPException: If an error occurs during the HTTP request.
     """
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                config["SPOTIFY_TOKEN_URL"], data=form_data, headers=headers
-            )
+        response = await get_http_client().post(
+            config["SPOTIFY_TOKEN_URL"], data=form_data, headers=headers
+        )
         response.raise_for_status()
     except httpx.HTTPStatusError as exc:
         raise HTTPException(
@@ -170,7 +178,7 @@ async def exchange_token_with_spotify(form_data: dict, headers: dict) -> dict[st
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY, detail=f"Network error occurred: {exc}"
         ) from exc
-    return response.json()
+    return orjson.loads(response.content)
 
 
 def is_user_authorized(db_session: Session) -> bool:
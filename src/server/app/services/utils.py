@@ -1,6 +1,8 @@
+import asyncio
 from random import choice
 from string import ascii_letters, digits
 from time import perf_counter
+from typing import Any, Awaitable
 
 from dotenv import dotenv_values, find_dotenv
 
@@ -22,6 +24,26 @@ def generate_random_string(length: int) -> str:
     return "".join(choice(letters) for _ in range(length))
 
 
+async def gather_or_cancel(*awaitables: Awaitable[Any]) -> list[Any]:
+    """
+    Run the awaitables concurrently and return their results in order.
+    Unlike asyncio.gather, the remaining awaitables are cancelled as soon as one of them fails,
+    and the first failure is raised as is rather than wrapped in an exception group.
+
+    Args:
+        *awaitables (Awaitable[Any]): The awaitables to run.
+
+    Returns:
+        list[Any]: The results of the awaitables, in the order they were given.
+    """
+    try:
+        async with asyncio.TaskGroup() as task_group:
+            tasks = [task_group.create_task(awaitable) for awaitable in awaitables]
+    except ExceptionGroup as exc_group:
+        raise exc_group.exceptions[0] from None
+    return [task.result() for task in tasks]
+
+
 def time_it_async(fn):
     async def inner(*args, **kwargs):
         start = perf_counter()
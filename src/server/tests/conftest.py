@@ -8,6 +8,8 @@ from sqlalchemy.pool import StaticPool
 
 from app.db.database import Base, get_db
 from app.main import app
+from app.services.token_manager import clear_token_cache
+from app.services.tracks_service import clear_playback_state_cache
 
 SQLITE_DATABASE_URL = "sqlite:///:memory:"
 
@@ -38,6 +40,20 @@ def db_session():
     connection.close()
 
 
+@pytest.fixture(autouse=True)
+def reset_token_cache():
+    """Drop the in-memory access token so it does not leak between tests."""
+    yield
+    clear_token_cache()
+
+
+@pytest.fixture(autouse=True)
+def reset_playback_state_cache():
+    """Drop cached playback states so they do not leak between tests."""
+    yield
+    clear_playback_state_cache()
+
+
 @pytest.fixture()
 def test_client(db_session):
     """Create a test client that uses the override_get_db fixture to return a session."""
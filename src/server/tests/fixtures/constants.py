@@ -34,6 +34,41 @@ ACCESS_TOKEN_EXAMPLE = {
     "expires_in": 3600,
 }
 
+PLAYLISTS_PAGE_EXAMPLE = {
+    "href": "https://api.spotify.com/v1/users/1/playlists?offset=0&limit=10",
+    "limit": 10,
+    "next": None,
+    "offset": 0,
+    "previous": None,
+    "total": 1,
+    "items": [
+        {
+            "id": "1",
+            "name": "test_spotify_fav",
+            "uri": "spotify:playlist:1",
+            "snapshot_id": "a",
+            "description": "",
+            "images": [],
+            "owner": {"id": "1", "display_name": "Test User"},
+            "tracks": {"href": "https://api.spotify.com/v1/playlists/1/tracks", "total": 2},
+        }
+    ],
+}
+PLAYLISTS_PAGE_CACHED_EXAMPLE = {
+    "total": 1,
+    "offset": 0,
+    "limit": 10,
+    "items": [
+        {
+            "id": "1",
+            "name": "test_spotify_fav",
+            "uri": "spotify:playlist:1",
+            "snapshot_id": "a",
+            "tracks": {"total": 2},
+        }
+    ],
+}
+
 TRACK_DATA_EXAMPLE = (10000, 12000, "Test track", "test_track_id")
 TRACK_DATA_DICT_EXAMPLE = {
     "track_id": "123",
@@ -44,10 +79,8 @@ TRACK_DATA_DICT_EXAMPLE = {
 GET_CURRENT_USER_URL = f"{ENV_CONFIG_EXAMPLE["SPOTIFY_API_URL"]}/me"
 GET_CURRENT_TRACK_URL = f"{ENV_CONFIG_EXAMPLE["SPOTIFY_API_URL"]}/me/player/currently-playing"
 GET_RECENTLY_PLAYED_TRACKS_URL = (
-    f"{ENV_CONFIG_EXAMPLE["SPOTIFY_API_URL"]}/me/player/recently-played?limit=1"
+    f"{ENV_CONFIG_EXAMPLE["SPOTIFY_API_URL"]}/me/player/recently-played"
 )
 GET_PLAYBACK_STATE_URL = f"{ENV_CONFIG_EXAMPLE["SPOTIFY_API_URL"]}/me/player"
-GET_MY_PLAYLISTS_URL = (
-    f"{ENV_CONFIG_EXAMPLE["SPOTIFY_API_URL"]}/users/1/playlists?offset=0&limit=10"
-)
+GET_MY_PLAYLISTS_URL = f"{ENV_CONFIG_EXAMPLE["SPOTIFY_API_URL"]}/users/1/playlists"
 CREATE_PLAYLIST_SERVICE_URL = f"{ENV_CONFIG_EXAMPLE["SPOTIFY_API_URL"]}/playlists/10/tracks"
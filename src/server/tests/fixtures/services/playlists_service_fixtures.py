@@ -58,6 +58,12 @@ def mock_fetch_listened_tracks():
         yield mock
 
 
+@pytest.fixture(scope="function")
+def mock_has_listened_tracks():
+    with patch("app.services.playlists_service.has_listened_tracks", return_value=True) as mock:
+        yield mock
+
+
 @pytest.fixture(scope="function")
 def mock_create_playlist_on_spotify():
     with patch(
@@ -81,6 +87,14 @@ def mock_get_all_playlists():
         yield mock
 
 
+@pytest.fixture(scope="function")
+def mock_get_playlists_from_spotify():
+    with patch(
+        "app.services.playlists_service.get_playlists_from_spotify", new_callable=AsyncMock
+    ) as mock:
+        yield mock
+
+
 @pytest.fixture(scope="function")
 def mock_sync_playlists():
     with patch("app.services.playlists_service.sync_playlists") as mock:
@@ -96,14 +110,55 @@ class MockRedisClient:
     async def get(self, key: str):
         return self.cache.get(key)
 
+    async def mget(self, *keys: str):
+        return [self.cache.get(key) for key in keys]
+
     async def set(self, key: str, value: str, ex: int = None):
         self.cache[key] = value
 
+    async def sadd(self, key: str, *members: str):
+        self.cache.setdefault(key, set()).update(members)
+
+    async def smembers(self, key: str):
+        return list(self.cache.get(key, set()))
+
+    async def expire(self, key: str, seconds: int):
+        return key in self.cache
+
+    async def delete(self, *keys: str):
+        return sum(self.cache.pop(key, None) is not None for key in keys)
+
+    def pipeline(self):
+        return MockRedisPipeline(self)
+
     async def close(self):
         self.cache.clear()
 
 
+class MockRedisPipeline:
+    def __init__(self, client: MockRedisClient):
+        self.client = client
+        self.commands = []
+
+    def set(self, key: str, value: str, ex: int = None):
+        self.commands.append((self.client.set, (key, value, ex)))
+        return self
+
+    def sadd(self, key: str, *members: str):
+        self.commands.append((self.client.sadd, (key, *members)))
+        return self
+
+    def expire(self, key: str, seconds: int):
+        self.commands.append((self.client.expire, (key, seconds)))
+        return self
+
+    async def exec(self):
+        return [await command(*args) for command, args in self.commands]
+
+
 @pytest.fixture(scope="function")
 def mock_redis():
-    with patch("app.services.playlists_service.Redis", MockRedisClient) as mock:
-        yield mock
+    with patch(
+        "app.services.playlists_service.get_redis_client", return_value=MockRedisClient()
+    ) as mock:
+        yield mock.return_value
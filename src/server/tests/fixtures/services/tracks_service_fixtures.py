@@ -38,6 +38,40 @@ def mock_extract_track_data():
         yield mock
 
 
+@pytest.fixture(scope="function")
+def mock_get_playback_state():
+    with patch("app.services.tracks_service.get_playback_state", new_callable=AsyncMock) as mock:
+        yield mock
+
+
+@pytest.fixture(scope="function")
+def mock_get_current_user_id():
+    with patch(
+        "app.services.tracks_service.get_current_user_id",
+        new_callable=AsyncMock,
+        return_value="test_user",
+    ) as mock:
+        yield mock
+
+
+@pytest.fixture(scope="function")
+def mock_is_user_authorized():
+    with patch("app.services.tracks_service.is_user_authorized", return_value=True) as mock:
+        yield mock
+
+
+@pytest.fixture(scope="function")
+def mock_handle_playing_track():
+    with patch("app.services.tracks_service.handle_playing_track", new_callable=AsyncMock) as mock:
+        yield mock
+
+
+@pytest.fixture(scope="function")
+def mock_asyncio_sleep():
+    with patch("app.services.tracks_service.asyncio.sleep", new_callable=AsyncMock) as mock:
+        yield mock
+
+
 @pytest.fixture(scope="function")
 def mock_process_playing_track():
     with patch("app.services.tracks_service.process_playing_track", new_callable=AsyncMock) as mock:
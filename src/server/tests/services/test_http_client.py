@@ -0,0 +1,54 @@
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from app.services.http_client import (
+    close_http_client,
+    get_http_client,
+    get_retry_delay,
+    send_with_rate_limit_retry,
+)
+
+
+@pytest.mark.asyncio
+async def test_get_http_client_reuses_instance():
+    client = get_http_client()
+    assert get_http_client() is client
+    await close_http_client()
+    assert client.is_closed
+    assert get_http_client() is not client
+    await close_http_client()
+
+
+@pytest.mark.asyncio
+async def test_send_with_rate_limit_retry():
+    send = AsyncMock(
+        side_effect=[
+            httpx.Response(429, headers={"Retry-After": "2"}),
+            httpx.Response(429),
+            httpx.Response(200),
+        ]
+    )
+    with patch("app.services.http_client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        response = await send_with_rate_limit_retry(send)
+    assert response.status_code == 200
+    assert send.await_count == 3
+    first_delay, second_delay = [call.args[0] for call in mock_sleep.await_args_list]
+    assert first_delay == 2.0
+    assert 2.0 <= second_delay <= 4.0
+
+
+@pytest.mark.parametrize(
+    "retry_after, expected_min, expected_max",
+    [
+        ("3", 3.0, 3.0),
+        ("Wed, 21 Oct 2015 07:28:00 GMT", 1.0, 2.0),
+        ("nan", 1.0, 2.0),
+        ("-5", 1.0, 2.0),
+        ("86400", 60.0, 60.0),
+    ],
+)
+def test_get_retry_delay(retry_after, expected_min, expected_max):
+    response = httpx.Response(429, headers={"Retry-After": retry_after})
+    assert expected_min <= get_retry_delay(response, 1.0) <= expected_max
@@ -1,11 +1,20 @@
 import json
+from unittest.mock import AsyncMock, Mock
 
 import httpx
+import orjson
 import pytest
 from fastapi import HTTPException, status
+from sqlalchemy import event
 
+from app.db.models import Playlist, Track
 from app.services.playlists_service import (
+    add_tracks_to_playlist,
     cache_playlist_tracks,
+    create_playlist,
+    create_playlist_in_db,
+    get_all_playlists,
+    get_db_playlist_tracks,
     get_playlists_from_spotify,
     process_playlist_creation,
 )
@@ -14,6 +23,8 @@ from ..conftest import db_session
 from ..fixtures.constants import (
     CREATE_PLAYLIST_SERVICE_URL,
     GET_MY_PLAYLISTS_URL,
+    PLAYLISTS_PAGE_CACHED_EXAMPLE,
+    PLAYLISTS_PAGE_EXAMPLE,
     SPOTIFY_HEADERS_EXAMPLE,
 )
 from ..fixtures.services.playlists_service_fixtures import (
@@ -24,7 +35,9 @@ from ..fixtures.services.playlists_service_fixtures import (
     mock_fetch_listened_tracks,
     mock_get_all_playlists,
     mock_get_current_user_id,
+    mock_get_playlists_from_spotify,
     mock_get_spotify_headers,
+    mock_has_listened_tracks,
     mock_redis,
     mock_sync_playlists,
 )
@@ -36,16 +49,17 @@ async def test_get_playlists_from_spotify_success(
     mock_get_spotify_headers,
     mock_async_client_get,
     mock_get_current_user_id,
+    mock_redis,
 ):
     mock_request = httpx.Request("GET", "mock_request")
     mock_async_client_get.return_value = httpx.Response(
-        status_code=status.HTTP_200_OK,
-        json={"playlist1": "playlist1", "playlist2": "playlist2"},
-        request=mock_request,
+        status_code=status.HTTP_200_OK, json=PLAYLISTS_PAGE_EXAMPLE, request=mock_request
     )
     response = await get_playlists_from_spotify(0, 10, db_session)
-    assert response == {"playlist1": "playlist1", "playlist2": "playlist2"}
-    mock_async_client_get.assert_awaited_with(GET_MY_PLAYLISTS_URL, headers=SPOTIFY_HEADERS_EXAMPLE)
+    assert response == PLAYLISTS_PAGE_CACHED_EXAMPLE
+    mock_async_client_get.assert_awaited_with(
+        GET_MY_PLAYLISTS_URL, headers=SPOTIFY_HEADERS_EXAMPLE, params={"offset": 0, "limit": 10}
+    )
 
 
 @pytest.mark.asyncio
@@ -54,6 +68,7 @@ async def test_get_playlists_from_spotify_failure(
     mock_get_spotify_headers,
     mock_async_client_get,
     mock_get_current_user_id,
+    mock_redis,
 ):
     mock_request = httpx.Request("GET", "mock_request")
     mock_async_client_get.return_value = httpx.Response(
@@ -65,10 +80,87 @@ async def test_get_playlists_from_spotify_failure(
         await get_playlists_from_spotify(0, 10, db_session)
     assert exc.value.status_code == status.HTTP_404_NOT_FOUND
     assert exc.value.detail == json.dumps({"ERROR": "ERROR"})
-    mock_async_client_get.assert_awaited_with(GET_MY_PLAYLISTS_URL, headers=SPOTIFY_HEADERS_EXAMPLE)
+    mock_async_client_get.assert_awaited_with(
+        GET_MY_PLAYLISTS_URL, headers=SPOTIFY_HEADERS_EXAMPLE, params={"offset": 0, "limit": 10}
+    )
     mock_get_spotify_headers.assert_called_once_with(db_session)
 
 
+@pytest.mark.asyncio
+async def test_get_playlists_from_spotify_cache_hit(
+    db_session,
+    mock_get_spotify_headers,
+    mock_async_client_get,
+    mock_get_current_user_id,
+    mock_redis,
+):
+    mock_request = httpx.Request("GET", "mock_request")
+    mock_async_client_get.return_value = httpx.Response(
+        status_code=status.HTTP_200_OK, json=PLAYLISTS_PAGE_EXAMPLE, request=mock_request
+    )
+    first_response = await get_playlists_from_spotify(0, 10, db_session)
+    second_response = await get_playlists_from_spotify(0, 10, db_session)
+    assert first_response == second_response == PLAYLISTS_PAGE_CACHED_EXAMPLE
+    assert mock_async_client_get.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_playlists_from_spotify_redis_unavailable(
+    db_session,
+    mock_get_spotify_headers,
+    mock_async_client_get,
+    mock_get_current_user_id,
+    mock_redis,
+):
+    mock_request = httpx.Request("GET", "mock_request")
+    mock_async_client_get.return_value = httpx.Response(
+        status_code=status.HTTP_200_OK, json=PLAYLISTS_PAGE_EXAMPLE, request=mock_request
+    )
+    mock_redis.get = AsyncMock(side_effect=ConnectionError("Redis is unavailable"))
+    mock_redis.pipeline = Mock(side_effect=ConnectionError("Redis is unavailable"))
+    response = await get_playlists_from_spotify(0, 10, db_session)
+    assert response == PLAYLISTS_PAGE_CACHED_EXAMPLE
+
+
+@pytest.mark.asyncio
+async def test_get_playlists_from_spotify_serves_stale_copy_on_server_error(
+    db_session,
+    mock_get_spotify_headers,
+    mock_async_client_get,
+    mock_get_current_user_id,
+    mock_redis,
+):
+    mock_request = httpx.Request("GET", "mock_request")
+    mock_async_client_get.side_effect = [
+        httpx.Response(
+            status_code=status.HTTP_200_OK, json=PLAYLISTS_PAGE_EXAMPLE, request=mock_request
+        ),
+        httpx.Response(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, request=mock_request),
+    ]
+    await get_playlists_from_spotify(0, 10, db_session)
+    await mock_redis.delete("playlists:1:0:10")
+    response = await get_playlists_from_spotify(0, 10, db_session)
+    assert response == PLAYLISTS_PAGE_CACHED_EXAMPLE
+    assert mock_async_client_get.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_all_playlists(
+    db_session, mock_get_spotify_headers, mock_get_current_user_id, mock_get_playlists_from_spotify
+):
+    total = 120
+
+    async def get_page(offset, limit, db_session, spotify_headers, user_id):
+        items = [{"id": str(index)} for index in range(offset, min(offset + limit, total))]
+        return {"items": items, "total": total}
+
+    mock_get_playlists_from_spotify.side_effect = get_page
+    response = await get_all_playlists(db_session)
+    assert response == {"playlists": [{"id": str(index)} for index in range(total)]}
+    assert mock_get_playlists_from_spotify.await_count == 3
+    mock_get_current_user_id.assert_awaited_once_with(db_session, SPOTIFY_HEADERS_EXAMPLE)
+
+
 @pytest.mark.asyncio
 async def test_process_playlist_creation_success(
     db_session,
@@ -77,8 +169,10 @@ async def test_process_playlist_creation_success(
     mock_get_current_user_id,
     mock_get_all_playlists,
     mock_fetch_listened_tracks,
+    mock_has_listened_tracks,
     mock_create_playlist_on_spotify,
     mock_sync_playlists,
+    mock_redis,
 ):
     mock_request = httpx.Request("POST", "mock_request")
     mock_async_client_post.return_value = httpx.Response(200, json={}, request=mock_request)
@@ -87,7 +181,7 @@ async def test_process_playlist_creation_success(
     mock_async_client_post.assert_awaited_with(
         CREATE_PLAYLIST_SERVICE_URL,
         headers=SPOTIFY_HEADERS_EXAMPLE,
-        json={"uris": ["spotify:track:10", "spotify:track:20"]},
+        content=orjson.dumps({"uris": ["spotify:track:10", "spotify:track:20"]}),
     )
 
 
@@ -99,8 +193,10 @@ async def test_process_playlist_creation_failure(
     mock_get_current_user_id,
     mock_get_all_playlists,
     mock_fetch_listened_tracks,
+    mock_has_listened_tracks,
     mock_create_playlist_on_spotify,
     mock_sync_playlists,
+    mock_redis,
 ):
     mock_request = httpx.Request("POST", "mock_request")
     mock_async_client_post.return_value = httpx.Response(
@@ -113,8 +209,93 @@ async def test_process_playlist_creation_failure(
     mock_async_client_post.assert_awaited_with(
         CREATE_PLAYLIST_SERVICE_URL,
         headers=SPOTIFY_HEADERS_EXAMPLE,
-        json={"uris": ["spotify:track:10", "spotify:track:20"]},
+        content=orjson.dumps({"uris": ["spotify:track:10", "spotify:track:20"]}),
     )
+    assert db_session.query(Playlist).count() == 0
+
+
+@pytest.mark.asyncio
+async def test_create_playlist_invalidates_playlists_cache(
+    db_session,
+    mock_async_client_post,
+    mock_create_playlist_on_spotify,
+    mock_redis,
+):
+    mock_request = httpx.Request("POST", "mock_request")
+    mock_async_client_post.return_value = httpx.Response(200, json={}, request=mock_request)
+    mock_redis.cache = {
+        "playlists:1:0:50": "{}",
+        "playlists:1:0:50:stale": "{}",
+        "playlists:1:keys": {"playlists:1:0:50", "playlists:1:0:50:stale"},
+        "playlists:2:0:50": "{}",
+    }
+    track = Track(title="Track A", spotify_id="a")
+    db_session.add(track)
+    db_session.commit()
+    await create_playlist("test", [track], 1, db_session, SPOTIFY_HEADERS_EXAMPLE)
+    assert list(mock_redis.cache) == ["playlists:2:0:50"]
+
+
+@pytest.mark.asyncio
+async def test_add_tracks_to_playlist_in_ordered_batches(mock_async_client_post):
+    mock_request = httpx.Request("POST", "mock_request")
+    mock_async_client_post.side_effect = [
+        httpx.Response(201, json={"snapshot_id": "a"}, request=mock_request),
+        httpx.Response(201, json={"snapshot_id": "b"}, request=mock_request),
+    ]
+    track_ids = [str(index) for index in range(150)]
+    snapshot_id = await add_tracks_to_playlist("10", track_ids, SPOTIFY_HEADERS_EXAMPLE)
+    payloads = [
+        orjson.loads(call.kwargs["content"]) for call in mock_async_client_post.call_args_list
+    ]
+    assert payloads == [
+        {"uris": [f"spotify:track:{index}" for index in range(100)]},
+        {"uris": [f"spotify:track:{index}" for index in range(100, 150)]},
+    ]
+    assert snapshot_id == "b"
+
+
+@pytest.mark.asyncio
+async def test_process_playlist_creation_no_listened_tracks(
+    db_session,
+    mock_get_spotify_headers,
+    mock_fetch_listened_tracks,
+    mock_sync_playlists,
+):
+    with pytest.raises(HTTPException):
+        await process_playlist_creation("test", db_session)
+    mock_get_spotify_headers.assert_not_called()
+    mock_sync_playlists.assert_not_called()
+    mock_fetch_listened_tracks.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_process_playlist_creation_statement_count(
+    db_session,
+    mock_get_spotify_headers,
+    mock_async_client_post,
+    mock_get_current_user_id,
+    mock_get_all_playlists,
+    mock_create_playlist_on_spotify,
+    mock_redis,
+):
+    mock_request = httpx.Request("POST", "mock_request")
+    mock_async_client_post.return_value = httpx.Response(200, json={}, request=mock_request)
+    mock_get_all_playlists.return_value = {"playlists": []}
+    tracks = [
+        Track(title=f"Track {index}", spotify_id=str(index), listened_count=1)
+        for index in range(20)
+    ]
+    db_session.add_all(tracks)
+    db_session.commit()
+    statements = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db_session.connection(), "before_cursor_execute", count_statement)
+    await process_playlist_creation("test", db_session)
+    assert len(statements) == 5
 
 
 @pytest.mark.asyncio
@@ -122,23 +303,19 @@ async def test_process_playlist_creation_failure(
     "playlists, mocked_responses, expected_result",
     [
         (
-            [{"uri": "spotify:playlist:1"}, {"uri": "spotify:playlist:2"}],
+            [{"id": "1"}, {"id": "2"}],
             [
                 {
-                    "tracks": {
-                        "items": [
-                            {"track": {"name": "Track A"}},
-                            {"track": {"name": "Track B"}},
-                        ]
-                    }
+                    "items": [
+                        {"track": {"name": "Track A"}},
+                        {"track": {"name": "Track B"}},
+                    ]
                 },
                 {
-                    "tracks": {
-                        "items": [
-                            {"track": {"name": "Track C"}},
-                            {"track": {"name": "Track D"}},
-                        ]
-                    }
+                    "items": [
+                        {"track": {"name": "Track C"}},
+                        {"track": {"name": "Track D"}},
+                    ]
                 },
             ],
             {"1": {"Track A", "Track B"}, "2": {"Track C", "Track D"}},
@@ -162,3 +339,118 @@ async def test_cache_playlist_tracks(
     result = await cache_playlist_tracks(playlists, db_session)
     assert result == expected_result
     assert mock_async_client_get.call_count == len(playlists)
+
+
+@pytest.mark.asyncio
+async def test_cache_playlist_tracks_paginated(
+    db_session,
+    mock_get_spotify_headers,
+    mock_async_client_get,
+    mock_redis,
+):
+    mock_request = httpx.Request("GET", "mock_request")
+    mock_async_client_get.side_effect = [
+        httpx.Response(
+            200,
+            json={"items": [{"track": {"name": "Track A"}}], "total": 101},
+            request=mock_request,
+        ),
+        httpx.Response(200, json={"items": [{"track": {"name": "Track B"}}]}, request=mock_request),
+    ]
+    result = await cache_playlist_tracks([{"id": "1"}], db_session)
+    assert result == {"1": {"Track A", "Track B"}}
+    assert mock_async_client_get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_playlist_tracks_cache_hit(
+    db_session,
+    mock_get_spotify_headers,
+    mock_async_client_get,
+    mock_redis,
+):
+    mock_request = httpx.Request("GET", "mock_request")
+    mock_async_client_get.return_value = httpx.Response(
+        200,
+        json={"items": [{"track": {"name": "Intro, Part 1"}}], "total": 1},
+        request=mock_request,
+    )
+    first_result = await cache_playlist_tracks([{"id": "1"}], db_session)
+    second_result = await cache_playlist_tracks([{"id": "1"}], db_session)
+    assert first_result == second_result == {"1": {"Intro, Part 1"}}
+    assert mock_async_client_get.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_playlist_tracks_snapshot_changed(
+    db_session,
+    mock_get_spotify_headers,
+    mock_async_client_get,
+    mock_redis,
+):
+    mock_request = httpx.Request("GET", "mock_request")
+    mock_async_client_get.side_effect = [
+        httpx.Response(
+            200, json={"items": [{"track": {"name": "Track A"}}], "total": 1}, request=mock_request
+        ),
+        httpx.Response(
+            200, json={"items": [{"track": {"name": "Track B"}}], "total": 1}, request=mock_request
+        ),
+    ]
+    await cache_playlist_tracks([{"id": "1", "snapshot_id": "a"}], db_session)
+    await cache_playlist_tracks([{"id": "1", "snapshot_id": "a"}], db_session)
+    result = await cache_playlist_tracks([{"id": "1", "snapshot_id": "b"}], db_session)
+    assert result == {"1": {"Track B"}}
+    assert mock_async_client_get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_playlist_tracks_known_total(
+    db_session,
+    mock_get_spotify_headers,
+    mock_async_client_get,
+    mock_redis,
+):
+    mock_request = httpx.Request("GET", "mock_request")
+    mock_async_client_get.side_effect = [
+        httpx.Response(200, json={"items": [{"track": {"name": "Track A"}}]}, request=mock_request),
+        httpx.Response(200, json={"items": [{"track": {"name": "Track B"}}]}, request=mock_request),
+    ]
+    result = await cache_playlist_tracks(
+        [{"id": "1", "tracks": {"total": 150}}, {"id": "2", "tracks": {"total": 0}}], db_session
+    )
+    assert result == {"1": {"Track A", "Track B"}, "2": set()}
+    assert mock_async_client_get.call_count == 2
+    offsets = {call.kwargs["params"]["offset"] for call in mock_async_client_get.call_args_list}
+    assert offsets == {0, 100}
+
+
+def test_get_db_playlist_tracks(db_session):
+    track_a = Track(title="Track A", spotify_id="a")
+    track_b = Track(title="Track B", spotify_id="b")
+    db_session.add_all([track_a, track_b])
+    db_session.commit()
+    create_playlist_in_db("first", "1", [track_a, track_b], db_session, "a")
+    create_playlist_in_db("second", "2", [track_b], db_session, "a")
+    create_playlist_in_db("empty", "3", [], db_session, "a")
+    create_playlist_in_db("edited", "4", [track_a], db_session, "a")
+    create_playlist_in_db("legacy", "5", [track_a], db_session)
+    playlists = [
+        {"id": "1", "snapshot_id": "a"},
+        {"id": "2", "snapshot_id": "a"},
+        {"id": "3", "snapshot_id": "a"},
+        {"id": "4", "snapshot_id": "b"},
+        {"id": "5", "snapshot_id": "a"},
+        {"id": "6", "snapshot_id": "a"},
+    ]
+    result = get_db_playlist_tracks(playlists, db_session)
+    assert result == {"1": {"Track A", "Track B"}, "2": {"Track B"}}
+
+
+def test_create_playlist_in_db(db_session):
+    tracks = [Track(title=f"Track {index}", spotify_id=str(index)) for index in range(3)]
+    db_session.add_all(tracks)
+    db_session.commit()
+    playlist = create_playlist_in_db("test_spotify_fav", "1", tracks, db_session)
+    assert playlist.track_titles == ["Track 0", "Track 1", "Track 2"]
+    assert {track.id for track in playlist.tracks} == {track.id for track in tracks}
@@ -1,3 +1,4 @@
+import asyncio
 from time import time
 
 import pytest
@@ -8,6 +9,7 @@ from app.db.models import AccessToken
 from app.services.token_manager import (
     RefreshTokenError,
     get_spotify_headers,
+    get_token,
     get_token_from_db,
     handle_token_refresh,
     is_token_expired,
@@ -54,6 +56,45 @@ def test_save_token(
         assert token.expires_at > time()
 
 
+def test_save_token_with_loaded_token(db_session):
+    token = AccessToken(access_token="old_access", refresh_token="old_refresh", expires_at=0)
+    db_session.add(token)
+    db_session.commit()
+    save_token("new_access", "new_refresh", 3600, db_session, token)
+    assert db_session.query(AccessToken).count() == 1
+    assert token.access_token == "new_access"
+    assert token.refresh_token == "new_refresh"
+    assert token.expires_at > time()
+
+
+@pytest.mark.asyncio
+async def test_get_token_cached(db_session, mock_token):
+    db_session.add(mock_token)
+    db_session.commit()
+    first_token = await get_token(db_session)
+    db_session.query(AccessToken).delete()
+    db_session.commit()
+    second_token = await get_token(db_session)
+    assert first_token == second_token
+    assert second_token["access_token"] == "valid_token"
+
+
+@pytest.mark.asyncio
+async def test_get_token_refreshes_once(db_session, expired_token, mock_refresh_access_token):
+    db_session.add(expired_token)
+    db_session.commit()
+
+    async def refresh(refresh_token, db_session, token):
+        await asyncio.sleep(0)
+        save_token("new_access", refresh_token, 3600, db_session, token)
+        return {"access_token": "new_access", "refresh_token": refresh_token, "expires_at": 3600}
+
+    mock_refresh_access_token.side_effect = refresh
+    tokens = await asyncio.gather(*[get_token(db_session) for _ in range(3)])
+    assert all(token["access_token"] == "new_access" for token in tokens)
+    mock_refresh_access_token.assert_awaited_once()
+
+
 def test_get_token_from_db_not_found(db_session):
     with pytest.raises(HTTPException) as exc:
         get_token_from_db(db_session)
@@ -1,14 +1,25 @@
+import asyncio
+from unittest.mock import patch
+
 import httpx
 import pytest
-from fastapi import HTTPException, status
+from fastapi import BackgroundTasks, HTTPException, status
+from sqlalchemy.exc import InvalidRequestError
 
-from app.db.models import Track
+from app.db.models import Track, UserPollingStatus
 from app.services.tracks_service import (
     fetch_listened_tracks,
     get_current_track,
     get_playback_state,
+    get_track_from_db,
     get_recently_played_tracks,
     handle_playing_track,
+    is_user_polling,
+    poll_playback_state,
+    start_polling_tracks,
+    update_polling_status,
+    update_track_listened_count,
+    wait_for_song_change,
 )
 
 from ..conftest import db_session
@@ -20,9 +31,14 @@ from ..fixtures.constants import (
 from ..fixtures.services.tracks_service_fixtures import (
     SPOTIFY_HEADERS_EXAMPLE,
     mock_async_client_get,
+    mock_asyncio_sleep,
     mock_config_env,
     mock_extract_track_data,
+    mock_get_current_user_id,
+    mock_get_playback_state,
     mock_get_spotify_headers,
+    mock_handle_playing_track,
+    mock_is_user_authorized,
     mock_process_playing_track,
 )
 
@@ -75,6 +91,7 @@ async def test_get_recently_played_tracks_success(
     mock_async_client_get.assert_awaited_with(
         GET_RECENTLY_PLAYED_TRACKS_URL,
         headers=SPOTIFY_HEADERS_EXAMPLE,
+        params={"limit": 1},
     )
     assert response == {"track1": "track1", "track2": "track2"}
 
@@ -92,6 +109,7 @@ async def test_get_recently_played_tracks_failure(
     mock_async_client_get.assert_awaited_with(
         GET_RECENTLY_PLAYED_TRACKS_URL,
         headers=SPOTIFY_HEADERS_EXAMPLE,
+        params={"limit": 1},
     )
     assert exc.value.status_code == status.HTTP_401_UNAUTHORIZED
     assert "Failed to fetch recently played tracks" in exc.value.detail
@@ -113,6 +131,63 @@ async def test_get_playback_state_success(
     assert response == {"state": "playing"}
 
 
+@pytest.mark.asyncio
+async def test_get_playback_state_cached(
+    db_session, mock_get_spotify_headers, mock_async_client_get, mock_config_env
+):
+    mock_request = httpx.Request("GET", "mock_request")
+    mock_async_client_get.return_value = httpx.Response(
+        status_code=status.HTTP_200_OK, json={"state": "playing"}, request=mock_request
+    )
+    first_response = await get_playback_state(db_session)
+    second_response = await get_playback_state(db_session)
+    mock_async_client_get.assert_awaited_once_with(
+        GET_PLAYBACK_STATE_URL,
+        headers=SPOTIFY_HEADERS_EXAMPLE,
+    )
+    assert first_response == second_response == {"state": "playing"}
+
+
+@pytest.mark.asyncio
+async def test_get_playback_state_cache_not_reused_after_token_change(
+    db_session, mock_get_spotify_headers, mock_async_client_get, mock_config_env
+):
+    mock_request = httpx.Request("GET", "mock_request")
+    mock_async_client_get.return_value = httpx.Response(
+        status_code=status.HTTP_200_OK, json={"state": "playing"}, request=mock_request
+    )
+    refreshed_headers = {**SPOTIFY_HEADERS_EXAMPLE, "Authorization": "Bearer refreshed_token"}
+    mock_get_spotify_headers.side_effect = [SPOTIFY_HEADERS_EXAMPLE, refreshed_headers]
+    await get_playback_state(db_session)
+    await get_playback_state(db_session)
+    assert mock_async_client_get.await_count == 2
+    mock_async_client_get.assert_awaited_with(GET_PLAYBACK_STATE_URL, headers=refreshed_headers)
+
+
+@pytest.mark.asyncio
+async def test_get_playback_state_not_modified(
+    db_session, mock_get_spotify_headers, mock_async_client_get, mock_config_env
+):
+    mock_request = httpx.Request("GET", "mock_request")
+    mock_async_client_get.side_effect = [
+        httpx.Response(
+            status_code=status.HTTP_200_OK,
+            json={"state": "playing"},
+            headers={"ETag": '"etag123"'},
+            request=mock_request,
+        ),
+        httpx.Response(status_code=status.HTTP_304_NOT_MODIFIED, request=mock_request),
+    ]
+    with patch("app.services.tracks_service.PLAYBACK_STATE_CACHE_TTL", 0):
+        await get_playback_state(db_session)
+        response = await get_playback_state(db_session)
+    mock_async_client_get.assert_awaited_with(
+        GET_PLAYBACK_STATE_URL,
+        headers={**SPOTIFY_HEADERS_EXAMPLE, "If-None-Match": '"etag123"'},
+    )
+    assert response == {"state": "playing"}
+
+
 @pytest.mark.asyncio
 async def test_get_playback_state_failure(
     db_session, mock_get_spotify_headers, mock_async_client_get, mock_config_env
@@ -143,7 +218,14 @@ async def test_handle_playing_track_success(
     }
     await handle_playing_track(state, db_session)
     mock_process_playing_track.assert_awaited_with(
-        None, True, False, "test track", "test_track_id", db_session
+        None,
+        True,
+        False,
+        "test track",
+        "test_track_id",
+        db_session,
+        remaining_ms=11102222,
+        stop_event=None,
     )
 
 
@@ -161,6 +243,108 @@ async def test_handle_playing_track_failure(
     mock_process_playing_track.assert_not_awaited()
 
 
+def test_get_track_from_db_by_spotify_id(db_session):
+    test_track = Track(title="test track", spotify_id="test_id", listened_count=5)
+    db_session.add(test_track)
+    db_session.commit()
+    assert get_track_from_db(db_session, "test_id") is test_track
+    assert get_track_from_db(db_session, "test track") is None
+
+
+@pytest.mark.asyncio
+async def test_update_track_listened_count(db_session, mock_get_playback_state, mock_asyncio_sleep):
+    test_track = Track(title="test track", spotify_id="test_id", listened_count=5)
+    db_session.add(test_track)
+    db_session.commit()
+    mock_get_playback_state.return_value = {"item": {"name": "next track"}}
+    await update_track_listened_count(test_track, db_session, remaining_ms=5000)
+    assert test_track.listened_count == 6
+    mock_asyncio_sleep.assert_awaited_once_with(5.5)
+
+
+@pytest.mark.asyncio
+async def test_update_polling_status_creates_and_updates_user_status(db_session):
+    await update_polling_status(db_session, enable=True, user_id="test_user")
+    await update_polling_status(db_session, enable=False, user_id="test_user")
+    statuses = db_session.query(UserPollingStatus).filter_by(user_id="test_user").all()
+    assert len(statuses) == 1
+    assert statuses[0].is_polling is False
+
+
+@pytest.mark.asyncio
+async def test_is_user_polling(db_session):
+    assert await is_user_polling("test_user", db_session) is False
+    await update_polling_status(db_session, enable=True, user_id="test_user")
+    assert await is_user_polling("test_user", db_session) is True
+
+
+@pytest.mark.asyncio
+async def test_poll_playback_state_stops_when_polling_disabled(
+    db_session, mock_get_current_user_id, mock_get_playback_state, mock_handle_playing_track
+):
+    await update_polling_status(db_session, enable=True, user_id="test_user")
+
+    async def stop_polling(state, db_session, stop_event):
+        await update_polling_status(db_session, enable=False, user_id="test_user")
+
+    mock_handle_playing_track.side_effect = stop_polling
+    await poll_playback_state(db_session)
+    mock_get_playback_state.assert_awaited_once_with(db_session)
+
+
+@pytest.mark.asyncio
+async def test_start_polling_tracks_concurrently(
+    db_session, mock_get_current_user_id, mock_is_user_authorized
+):
+    async def update_after_yielding(*args, **kwargs):
+        await asyncio.sleep(0)
+        await update_polling_status(*args, **kwargs)
+
+    background_tasks = BackgroundTasks()
+    with patch(
+        "app.services.tracks_service.update_polling_status", side_effect=update_after_yielding
+    ):
+        results = await asyncio.gather(
+            start_polling_tracks(background_tasks, db_session),
+            start_polling_tracks(background_tasks, db_session),
+            return_exceptions=True,
+        )
+    conflicts = [result for result in results if isinstance(result, HTTPException)]
+    assert len(conflicts) == 1
+    assert conflicts[0].status_code == status.HTTP_409_CONFLICT
+    assert len(background_tasks.tasks) == 1
+
+
+@pytest.mark.asyncio
+async def test_wait_for_song_change_sleeps_until_track_ends(
+    db_session, mock_get_playback_state, mock_asyncio_sleep
+):
+    mock_get_playback_state.return_value = {"item": {"name": "next track"}}
+    await wait_for_song_change("test track", db_session, remaining_ms=5000)
+    mock_asyncio_sleep.assert_awaited_once_with(5.5)
+    mock_get_playback_state.assert_awaited_once_with(db_session)
+
+
+@pytest.mark.asyncio
+async def test_wait_for_song_change_ends_when_stopped(db_session, mock_get_playback_state):
+    stop_event = asyncio.Event()
+    stop_event.set()
+    await asyncio.wait_for(
+        wait_for_song_change("test track", db_session, remaining_ms=300000, stop_event=stop_event),
+        timeout=1,
+    )
+    mock_get_playback_state.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_wait_for_song_change_gives_up_after_max_polls(
+    db_session, mock_get_playback_state, mock_asyncio_sleep
+):
+    mock_get_playback_state.return_value = {"item": {"name": "test track"}}
+    await wait_for_song_change("test track", db_session, remaining_ms=5000)
+    assert mock_get_playback_state.await_count == 10
+
+
 def test_fetch_listened_tracks_success(db_session):
     test_track = Track(title="Test Track", spotify_id="test_id", listened_count=5)
     db_session.add(test_track)
@@ -174,6 +358,15 @@ def test_fetch_listened_tracks_success(db_session):
     assert fetched_track.listened_count == test_track.listened_count
 
 
+def test_fetch_listened_tracks_raises_on_lazy_load(db_session):
+    db_session.add(Track(title="Test Track", spotify_id="test_id", listened_count=5))
+    db_session.commit()
+    db_session.expunge_all()
+    fetched_track = fetch_listened_tracks(db_session)[0]
+    with pytest.raises(InvalidRequestError):
+        fetched_track.playlists
+
+
 def test_fetch_listened_tracks_failure(db_session):
     test_track = Track(title="Test Track", spotify_id="test_id", listened_count=0)
     db_session.add(test_track)